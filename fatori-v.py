@@ -35,25 +35,56 @@
 from __future__ import annotations
 
 import sys
-import shutil
 import random
+import functools
+import concurrent.futures
 import pathlib
 import os
+import re
 import subprocess
-import select
+import selectors
 from typing import Any, Dict, List, Tuple, Optional
 import json
+from types import SimpleNamespace
 
-# --- Load settings from ./settings.py (same folder as this script) -----------
-import importlib.util as _importlib_util
-
+# --- Load settings from ./fatori_settings.py (same folder as this script) ---
+# A regular import lets the interpreter reuse its .pyc cache on warm starts,
+# and pool workers can import the same module instead of re-executing it.
 _THIS_DIR = pathlib.Path(__file__).resolve().parent
-_SETTINGS_PATH = _THIS_DIR / "settings.py"
-_spec = _importlib_util.spec_from_file_location("fatori_v_settings", str(_SETTINGS_PATH))
-if _spec is None or _spec.loader is None:
-    raise RuntimeError("Failed to load settings.py alongside fatori-v.py")
-_settings = _importlib_util.module_from_spec(_spec)
-_spec.loader.exec_module(_settings)  # type: ignore
+if str(_THIS_DIR) not in sys.path:
+    sys.path.insert(0, str(_THIS_DIR))
+try:
+    import fatori_settings as _settings  # type: ignore
+except ImportError as e:
+    raise RuntimeError("Failed to load fatori_settings.py alongside fatori-v.py") from e
+
+# Settings read by the per-run loop, resolved once (defaults applied here) so
+# the loop body does plain attribute reads instead of repeated getattr calls.
+_S = SimpleNamespace(
+    runs_dir=_settings.RUNS_DIR_NAME,
+    results_dir=_settings.RESULTS_DIR_NAME,
+    reports_subdir=_settings.TOP_SUBDIR_REPORTS,
+    plots_subdir=_settings.TOP_SUBDIR_PLOTS,
+    default_seed=_settings.DEFAULT_GLOBAL_SEED,
+    sem_device=_settings.DEFAULT_SEM_DEVICE,
+    baudrate=_settings.DEFAULT_BAUDRATE,
+    session_label=_settings.DEFAULT_SESSION_LABEL,
+    defs_final_path=getattr(_settings, "DEFINES_FINAL_PATH", "."),
+    defs_subdir=getattr(_settings, "DEFINES_RESULTS_SUBDIR", "gen"),
+    defs_copy=bool(getattr(_settings, "DEFINES_COPY_TO_RESULTS", True)),
+    subprocess_verbose=bool(getattr(_settings, "SUBPROCESS_VERBOSE", False)),
+    apply_tcl=bool(getattr(_settings, "APPLY_PBLOCKS_TCL", False)),
+    vivado_bin=str(getattr(_settings, "VIVADO_BIN", "vivado")),
+    vivado_xpr=getattr(_settings, "VIVADO_XPR", None),
+)
+
+# Finish-line hints compiled into one alternation so each FI line is scanned
+# once regardless of how many hints are configured (None when no hints).
+# The pattern is bytes so FI output can be matched before any decoding.
+_FINISH_RE = (
+    re.compile(b"|".join(re.escape(h.encode("utf-8")) for h in _settings.FINISH_LINE_HINTS))
+    if _settings.FINISH_LINE_HINTS else None
+)
 
 # --- YAML loader (PyYAML expected; clear error if missing) -------------------
 try:
@@ -64,6 +95,9 @@ except Exception as e:
         "Install with 'pip install pyyaml'."
     ) from e
 
+# Prefer the LibYAML-backed loader (C parser); fall back to the pure-Python one.
+_YLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # ---------- ANSI helpers -----------------------------------------------------
 ANSI = {
@@ -81,34 +115,37 @@ ANSI = {
     "xterm_yellow": "\x1b[38;5;226m",
 }
 
+_RESET = ANSI["reset"]
+
+@functools.lru_cache(maxsize=64)
+def _sty_prefix(names: Tuple[str, ...]) -> str:
+    return "".join(ANSI[n] for n in names if n in ANSI)
+
 def _sty(s: str, *names: str) -> str:
-    return "".join(ANSI[n] for n in names if n in ANSI) + s + ANSI["reset"]
+    return _sty_prefix(names) + s + _RESET
 
 LINE_WIDTH = 110
+@functools.lru_cache(maxsize=16)
 def _rule(ch: str, n: int = LINE_WIDTH) -> str:
     return ch * n
+@functools.lru_cache(maxsize=4)
 def _rule_alt_hashes(start_with_yellow: bool) -> str:
     """
     Build a full-width '#' rule with alternating colors per character:
     canary yellow and light blue. If start_with_yellow is True, the first '#'
     is yellow; otherwise it starts blue (the order is inverted).
+    The result depends only on the flag and LINE_WIDTH, so it is memoized.
     """
-    plain = _rule("#")                      # same width as your headers
-    width = len(plain)
-    y = ANSI.get("xterm_yellow") or ANSI["yellow"]
-    b = ANSI["br_cyan"]                    # light blue
-    out = []
-    pick_yellow = start_with_yellow
-    for _ in range(width):
-        out.append((y if pick_yellow else b) + "#" + ANSI["reset"])
-        pick_yellow = not pick_yellow
-    return "".join(out)
+    width = LINE_WIDTH                     # same width as your headers
+    y_hash = (ANSI.get("xterm_yellow") or ANSI["yellow"]) + "#" + ANSI["reset"]
+    b_hash = ANSI["br_cyan"] + "#" + ANSI["reset"]   # light blue
+    first, second = (y_hash, b_hash) if start_with_yellow else (b_hash, y_hash)
+    return "".join((first, second) * (width // 2)) + (first if width % 2 else "")
 
 def _center(text: str, width: int = LINE_WIDTH) -> str:
-    if len(text) >= width:
-        return text
-    pad = (width - len(text)) // 2
-    return " " * pad + text
+    # Left-pad only (no trailing spaces); rjust is a no-op when text is wider.
+    n = len(text)
+    return text.rjust(n + (width - n) // 2)
 
 
 # ---------- Helpers: filesystem, YAML traversal, and FI console tee ----------
@@ -116,6 +153,121 @@ def _ensure_dir(p: pathlib.Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
+def _fast_copy(src: pathlib.Path, dst: pathlib.Path) -> None:
+    """
+    Copy file contents src -> dst without copystat. Uses os.copy_file_range
+    (in-kernel, Linux) when available; otherwise a single read/write, which is
+    the cheapest path for the small YAML snapshots this is used for.
+    """
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            copy_range = getattr(os, "copy_file_range", None)
+            if copy_range is not None:
+                try:
+                    while copy_range(src_fd, dst_fd, 1 << 20) > 0:
+                        pass
+                    return
+                except OSError:
+                    # Unsupported on this filesystem: restart with plain I/O.
+                    os.lseek(src_fd, 0, os.SEEK_SET)
+                    os.ftruncate(dst_fd, 0)
+                    os.lseek(dst_fd, 0, os.SEEK_SET)
+            with os.fdopen(src_fd, "rb", closefd=False) as fin:
+                data = fin.read()
+            view = memoryview(data)
+            while view:
+                view = view[os.write(dst_fd, view):]
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+# Parsed run YAMLs keyed by (path, mtime_ns, size); shared by the preview
+# pass and the per-run loop so each file is parsed once per invocation.
+_CFG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# Sidecar folder (under results/) holding JSON snapshots of parsed run YAMLs.
+_YAML_CACHE_SUBDIR = ".yaml_cache"
+
+
+def _load_cfg(path: pathlib.Path, cache_dir: Optional[pathlib.Path] = None) -> Dict[str, Any]:
+    """
+    Read and parse a run YAML once; later calls reuse the parsed dict.
+
+    If cache_dir is given, the parsed document is also mirrored there as JSON
+    (<yaml_name>.json) together with the YAML's (mtime_ns, size). A snapshot
+    whose recorded pair matches the YAML exactly is loaded instead of
+    re-parsing; any edit or restore that changes either value invalidates it.
+    Documents that do not survive a JSON round-trip are never cached.
+    """
+    st = path.stat()
+    mem_key = (str(path), st.st_mtime_ns, st.st_size)
+    cfg = _CFG_CACHE.get(mem_key)
+    if cfg is not None:
+        return cfg
+
+    side = (cache_dir / f"{path.name}.json") if cache_dir is not None else None
+    if side is not None:
+        try:
+            snap = json.loads(side.read_bytes())
+            if isinstance(snap, dict) and snap.get("src") == [st.st_mtime_ns, st.st_size]:
+                cfg = snap.get("cfg")
+        except (OSError, ValueError):
+            cfg = None
+
+    if cfg is None:
+        cfg = yaml.load(path.read_bytes(), Loader=_YLoader) or {}
+        if side is not None:
+            try:
+                dumped = json.dumps(cfg)
+                if json.loads(dumped) == cfg:
+                    side.parent.mkdir(parents=True, exist_ok=True)
+                    snap = json.dumps({"src": [st.st_mtime_ns, st.st_size], "cfg": cfg})
+                    side.write_text(snap, encoding="utf-8")
+            except (OSError, TypeError, ValueError):
+                pass
+
+    _CFG_CACHE[mem_key] = cfg
+    return cfg
+
+
+
+def _parse_one(path: pathlib.Path, cache_dir: Optional[pathlib.Path] = None) -> Tuple[Optional[Tuple[int, int]], Optional[Dict[str, Any]]]:
+    # Worker body for _preload_cfgs: returns ((mtime_ns, size), cfg), or
+    # (None, None) if the file cannot be parsed (the caller reports it later).
+    try:
+        st = path.stat()
+        return (st.st_mtime_ns, st.st_size), _load_cfg(path, cache_dir)
+    except Exception:
+        return None, None
+
+
+def _preload_cfgs(paths: List[pathlib.Path], cache_dir: Optional[pathlib.Path] = None) -> None:
+    """
+    Parse all run YAMLs up front and seed _CFG_CACHE, so the preview and the
+    per-run loop never parse a file twice. With more than two files the work
+    is spread over a process pool (YAML parsing is CPU-bound and holds the
+    GIL); otherwise, or if a pool cannot be started, it stays sequential.
+    """
+    if len(paths) <= 2:
+        for p in paths:
+            _parse_one(p, cache_dir)
+        return
+    try:
+        workers = min(os.cpu_count() or 1, len(paths))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(functools.partial(_parse_one, cache_dir=cache_dir), paths, chunksize=4))
+    except Exception:
+        for p in paths:
+            _parse_one(p, cache_dir)
+        return
+    for p, (key, cfg) in zip(paths, results):
+        if key is not None and cfg is not None:
+            _CFG_CACHE[(str(p),) + key] = cfg
+
 def _safe_get(dct: Dict[str, Any], path: List[str], default: Any = None) -> Any:
     """Traverse a nested dict with a list of keys; return default if any missing."""
     cur = dct
@@ -126,6 +278,22 @@ def _safe_get(dct: Dict[str, Any], path: List[str], default: Any = None) -> Any:
     return cur
 
 
+
+# Hand-written accessors for the fixed paths read on every run; they avoid the
+# generic loop in _safe_get and keep its "missing -> default" semantics.
+def _get_run_ident(cfg: Dict[str, Any], key: str, default: Any = None) -> Any:
+    """cfg['run']['identification'][key], or default if any level is missing."""
+    r = cfg.get("run") if isinstance(cfg, dict) else None
+    i = r.get("identification") if isinstance(r, dict) else None
+    return i.get(key, default) if isinstance(i, dict) else default
+
+
+def _get_fi_general(cfg: Dict[str, Any], key: str, default: Any = None) -> Any:
+    """cfg['general']['fault_injection'][key], or default if any level is missing."""
+    g = cfg.get("general") if isinstance(cfg, dict) else None
+    f = g.get("fault_injection") if isinstance(g, dict) else None
+    return f.get(key, default) if isinstance(f, dict) else default
+
 def _kv_csv(opts: Dict[str, Any]) -> str:
     """
     Convert a flat dict into CSV 'k=v' suitable for fi.fault_injection.
@@ -249,107 +417,155 @@ def _build_time_args(yaml_root: Dict[str, Any], profile: str) -> Tuple[str, Dict
     return _kv_csv(opts), opts
 
 
+# Batching of FI console output when stdout is not a TTY
+_STDOUT_FLUSH_BYTES = 32 * 1024
+_STDOUT_IDLE_FLUSH_S = 0.05
+
 def _tee_and_autofinish(proc: subprocess.Popen) -> int:
     """
     Stream FI stdout to our console, forward user stdin lines to FI, and monitor
     for finish-line hints. Once a hint appears, send 'exit' to FI exactly once.
     Return FI's exit code.
+
+    The child pipes are unbuffered bytes: stdout is drained in 64 KiB chunks
+    and split into lines here, so a burst of output costs one read instead of
+    one readline per line. Waiting is done through a selector (epoll/kqueue
+    where available) that blocks until there is data; the child's exit is
+    watched through a pidfd when the platform provides one.
     """
     exit_sent = False
     assert proc.stdout is not None
-    while True:
-        try:
-            # Multiplex child's stdout and our stdin
-            r, _, _ = select.select([proc.stdout, sys.stdin], [], [], 0.1)
-        except Exception:
-            r = [proc.stdout]
-
-        if proc.stdout in r:
-            line = proc.stdout.readline()
-            if line == "":
-                break  # child ended
-            line = line.rstrip("\n")
-            print(line)
-            if (not exit_sent) and any(h in line for h in _settings.FINISH_LINE_HINTS):
-                try:
-                    if proc.stdin:
-                        proc.stdin.write("exit\n")
-                        proc.stdin.flush()
-                    exit_sent = True
-                except Exception:
-                    exit_sent = True
-
-        if sys.stdin in r:
+    out_fd = proc.stdout.fileno()
+    buf = b""
+
+    # On a terminal every line is flushed for interactivity; when piped or
+    # redirected, output is coalesced and flushed every 32 KiB or once FI has
+    # been quiet for 50 ms.
+    interactive = sys.stdout.isatty()
+    pending = 0
+
+    # Non-TTY output goes to the binary layer untouched (no decode/encode per
+    # line); anything already queued on the text layer is flushed first so
+    # the two layers cannot reorder.
+    out_bin = None if interactive else getattr(sys.stdout, "buffer", None)
+    if out_bin is not None:
+        sys.stdout.flush()
+
+    def _flush() -> None:
+        nonlocal pending
+        sys.stdout.flush()
+        pending = 0
+
+    def _emit(raw: bytes) -> None:
+        nonlocal exit_sent, pending
+        line = raw.rstrip(b"\r")
+        if out_bin is not None:
+            out_bin.write(line)
+            out_bin.write(b"\n")
+        else:
+            sys.stdout.write(line.decode("utf-8", "replace"))
+            sys.stdout.write("\n")
+        if interactive:
+            sys.stdout.flush()
+        else:
+            pending += len(line) + 1
+            if pending >= _STDOUT_FLUSH_BYTES:
+                _flush()
+        if (not exit_sent) and _FINISH_RE is not None and _FINISH_RE.search(line):
             try:
-                user_line = sys.stdin.readline()
+                if proc.stdin:
+                    proc.stdin.write(b"exit\n")
+                    proc.stdin.flush()
+                exit_sent = True
             except Exception:
-                user_line = ""
-            if user_line == "":
-                # stdin EOF; do nothing special
-                pass
+                exit_sent = True
+
+    def _drain_child() -> bool:
+        # Read one chunk from FI; returns False on EOF.
+        nonlocal buf
+        chunk = os.read(out_fd, 65536)
+        if not chunk:
+            if buf:
+                _emit(buf)  # unterminated last line
+                buf = b""
+            return False
+        buf += chunk
+        *lines, buf = buf.split(b"\n")
+        for raw in lines:
+            _emit(raw)
+        return True
+
+    sel = selectors.DefaultSelector()
+    sel.register(out_fd, selectors.EVENT_READ, "child")
+    try:
+        sel.register(sys.stdin, selectors.EVENT_READ, "user")
+    except Exception:
+        pass  # stdin closed or not selectable; nothing to forward
+
+    # pidfd becomes readable when FI exits (Linux >= 5.3); otherwise poll.
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+            sel.register(pidfd, selectors.EVENT_READ, "exit")
+        except OSError:
+            pidfd = None
+
+    try:
+        child_done = False
+        while not child_done:
+            if pending:
+                timeout = _STDOUT_IDLE_FLUSH_S
             else:
-                try:
-                    if proc.stdin:
-                        proc.stdin.write(user_line)
-                        proc.stdin.flush()
-                except Exception:
-                    pass
-
-        if proc.poll() is not None:
-            break
+                timeout = 1.0 if pidfd is None else None
+            events = sel.select(timeout=timeout)
+            if not events and pending:
+                _flush()
+            for key, _ in events:
+                if key.data == "child":
+                    if not _drain_child():
+                        sel.unregister(out_fd)
+                        child_done = True  # child ended
+                elif key.data == "user":
+                    try:
+                        user_line = sys.stdin.readline()
+                    except Exception:
+                        user_line = ""
+                    if user_line == "":
+                        # stdin EOF; stop watching it
+                        sel.unregister(sys.stdin)
+                    else:
+                        try:
+                            if proc.stdin:
+                                proc.stdin.write(user_line.encode("utf-8"))
+                                proc.stdin.flush()
+                        except Exception:
+                            pass
+                elif key.data == "exit":
+                    child_done = True
+
+            if child_done:
+                break
+            if pidfd is None and proc.poll() is not None:
+                break
+
+        # FI has exited: flush whatever it already wrote without blocking on a
+        # pipe that a grandchild may still hold open.
+        if out_fd in sel.get_map():
+            while any(k.data == "child" for k, _ in sel.select(timeout=0)):
+                if not _drain_child():
+                    break
+            if buf:
+                _emit(buf)
+    finally:
+        _flush()
+        sel.close()
+        if pidfd is not None:
+            os.close(pidfd)
 
     proc.wait()
     return int(proc.returncode or 0)
 
-def _load_modules_map(root_dir: Path, map_rel_path: str) -> dict:
-    p = (root_dir / map_rel_path).resolve()
-    with p.open("r", encoding="utf-8") as fh:
-        return yaml.safe_load(fh) or {}
-
-def _enabled_targets_from_yaml(cfg: dict) -> list[str]:
-    # Reads specifics.fault_injection.area.modules.targets and returns enabled keys.
-    tmap = (cfg.get("specifics", {}) or {}).get("fault_injection", {}).get("area", {}) or {}
-    msec = tmap.get("modules", {}) or {}
-    targets = msec.get("targets", {}) or {}
-    enabled = []
-    for name, val in targets.items():
-        v = (str(val).strip().lower() if not isinstance(val, bool) else ("on" if val else "off"))
-        if v in ("on", "true", "1", "yes"):
-            enabled.append(name)
-    return sorted(enabled)
-
-def _resolve_rects_for_targets(modmap: dict, selected: list[str]) -> dict[str, list[dict]]:
-    out = {}
-    tmap = (modmap or {}).get("targets", {}) or {}
-    for name in selected:
-        info = tmap.get(name, {}) or {}
-        rects = info.get("rects", []) or []
-        if rects:
-            out[name] = rects
-    return out
-
-def _write_pblocks_tcl(out_path: Path, target_rects: dict[str, list[dict]]) -> None:
-    # Creates pblocks for enabled targets, resizes them to the SLICE rectangles,
-    # and attaches RTL cells by REF_NAME == <target>. Source in Vivado before P&R.
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as fh:
-        fh.write("# =============================================================================\n")
-        fh.write("# FATORI-V • Generated Pblock TCL (per-run)\n")
-        fh.write("# =============================================================================\n\n")
-        for tgt, rects in target_rects.items():
-            pblock = f"pblock_{tgt}"
-            fh.write(f"create_pblock {pblock}\n")
-            for r in rects:
-                x0, y0, x1, y1 = int(r['x0']), int(r['y0']), int(r['x1']), int(r['y1'])
-                fh.write(f"resize_pblock [get_pblocks {pblock}] -add {{SLICE_X{x0}Y{y0}:SLICE_X{x1}Y{y1}}}\n")
-            fh.write(f"set _cells [get_cells -hier -filter {{REF_NAME == {tgt}}}]\n")
-            fh.write(f"if {{[llength $_cells] > 0}} {{\n")
-            fh.write(f"  add_cells_to_pblock [get_pblocks {pblock}] $_cells\n")
-            fh.write(f"}} else {{\n")
-            fh.write(f"  puts \"[INFO] No cells found with REF_NAME == {tgt}\"\n")
-            fh.write(f"}}\n\n")
-
-            
 # ---------- Banner helpers ---------------------------------------------------
 
 def _nl(n: int = 1) -> None:
@@ -403,8 +619,8 @@ def _print_per_run_header(run_name: str, yaml_name: str, area_prof: str, time_pr
         # Concise pblocks notices shown immediately after NEW RUN header.
         # They intentionally mirror the results/ path (blue [INFO] like the rest).
         try:
-            _defs_subdir = getattr(_settings, "DEFINES_RESULTS_SUBDIR", "gen")
-            _results_root = getattr(_settings, "RESULTS_DIR_NAME", "results")
+            _defs_subdir = _S.defs_subdir
+            _results_root = _S.results_dir
             _info_c = ANSI.get("br_blue", ANSI.get("blue", ""))
             _reset = ANSI.get("reset", "")
             print(f"{_info_c}[INFO] Wrote: fatori-v/{_results_root}/{run_name}/{_defs_subdir}/fatori_pblocks.svh")
@@ -424,20 +640,24 @@ def _print_end_of_run() -> None:
 
 
 # ---------- Load modules map (board rectangles) -------------------------------
-def _load_modules_map(root_dir: Path, map_rel_path: str) -> dict:
+def _load_modules_map(root_dir: pathlib.Path, map_rel_path: str) -> dict:
+    # Whole-file bytes: libyaml scans one buffer instead of pulling through a
+    # text-mode file object chunk by chunk.
     p = (root_dir / map_rel_path).resolve()
-    with p.open("r", encoding="utf-8") as fh:
-        return yaml.safe_load(fh) or {}
-
-def _enabled_targets_from_yaml(cfg: dict) -> list[str]:
-    tmap = (cfg.get("specifics", {}) or {}).get("fault_injection", {}).get("area", {}) or {}
-    msec = tmap.get("module", {}) or {}
-    targets = msec.get("targets", {}) or {}
-    enabled = []
-    for name, val in targets.items():
-        v = str(val).strip().lower() if not isinstance(val, bool) else ("on" if val else "off")
-        if v in ("on", "true", "1", "yes"):
-            enabled.append(name)
+    return yaml.load(p.read_bytes(), Loader=_YLoader) or {}
+
+def _enabled_labels(cfg: dict) -> list[str]:
+    # Reads specifics.fault_injection.area.modules(module).targets and returns
+    # the sorted, de-duplicated names whose value is on/true/1/yes.
+    targets = _safe_get(cfg, ["specifics", "fault_injection", "area", "modules", "targets"], {}) or {}
+    if not targets:
+        targets = _safe_get(cfg, ["specifics", "fault_injection", "area", "module", "targets"], {}) or {}
+    enabled = set()
+    if isinstance(targets, dict):
+        for name, val in targets.items():
+            v = str(val).strip().lower() if not isinstance(val, bool) else ("on" if val else "off")
+            if v in ("on", "true", "1", "yes"):
+                enabled.add(str(name))
     return sorted(enabled)
 
 def _resolve_rects_for_targets(modmap: dict, selected: list[str]) -> dict[str, list[dict]]:
@@ -450,39 +670,71 @@ def _resolve_rects_for_targets(modmap: dict, selected: list[str]) -> dict[str, l
             out[name] = rects
     return out
 
-def _write_pblocks_tcl(out_path: Path, target_rects: dict[str, list[dict]]) -> None:
+def _write_pblocks_tcl(out_path: pathlib.Path, target_rects: dict[str, list[dict]]) -> None:
+    # Creates pblocks for enabled targets, resizes them to the SLICE rectangles,
+    # and attaches RTL cells by REF_NAME == <target>. Source in Vivado before P&R.
+    # The whole script is assembled in memory and written with a single call.
+    parts: List[str] = [
+        "# =============================================================================\n",
+        "# FATORI-V • Generated Pblock TCL (per-run)\n",
+        "# =============================================================================\n\n",
+    ]
+    for tgt, rects in target_rects.items():
+        pblock = f"pblock_{tgt}"
+        parts.append(f"create_pblock {pblock}\n")
+        for r in rects:
+            x0, y0, x1, y1 = int(r['x0']), int(r['y0']), int(r['x1']), int(r['y1'])
+            parts.append(f"resize_pblock [get_pblocks {pblock}] -add {{SLICE_X{x0}Y{y0}:SLICE_X{x1}Y{y1}}}\n")
+        parts.append(f"set _cells [get_cells -hier -filter {{REF_NAME == {tgt}}}]\n")
+        parts.append(f"if {{[llength $_cells] > 0}} {{\n")
+        parts.append(f"  add_cells_to_pblock [get_pblocks {pblock}] $_cells\n")
+        parts.append(f"}} else {{\n")
+        parts.append(f"  puts \"[INFO] No cells found with REF_NAME == {tgt}\"\n")
+        parts.append(f"}}\n\n")
     out_path.parent.mkdir(parents=True, exist_ok=True)
     with out_path.open("w", encoding="utf-8") as fh:
-        fh.write("# Auto-generated by fatori-v.py — per-run pblock definitions\n")
-        fh.write("# Source this TCL in Vivado to create/resize pblocks.\n\n")
-        for tgt, rects in target_rects.items():
-            pblock_name = f"pblock_{tgt}"
-            fh.write(f"create_pblock {pblock_name}\n")
-            for r in rects:
-                x0, y0, x1, y1 = int(r["x0"]), int(r["y0"]), int(r["x1"]), int(r["y1"])
-                fh.write(f"resize_pblock [get_pblocks {pblock_name}] -add {{SLICE_X{x0}Y{y0}:SLICE_X{x1}Y{y1}}}\n")
-            fh.write("\n")
+        fh.write("".join(parts))
 
 # ---------- Main runner: iterate YAML files and invoke FI one by one ---------
 def main(argv: Optional[List[str]] = None) -> int:
     # Resolve base folders relative to fatori-v.py
-    runs_dir = (_THIS_DIR / _settings.RUNS_DIR_NAME).resolve()
-    results_dir = (_THIS_DIR / _settings.RESULTS_DIR_NAME).resolve()
+    runs_dir = (_THIS_DIR / _S.runs_dir).resolve()
+    results_dir = (_THIS_DIR / _S.results_dir).resolve()
     _ensure_dir(runs_dir)
     _ensure_dir(results_dir)
 
-    # Discover YAML files (top-level only; no subdirectories)
-    yaml_paths: List[pathlib.Path] = []
-    yaml_paths.extend(sorted(pathlib.Path(runs_dir).glob("*.yaml")))
-    yaml_paths.extend(sorted(pathlib.Path(runs_dir).glob("*.yml")))
+    # When orchestrated to a pipe/file, let stdout buffer; _tee_and_autofinish
+    # flushes in batches. Terminals keep their usual line buffering.
+    if not sys.stdout.isatty():
+        try:
+            sys.stdout.reconfigure(line_buffering=False, write_through=False)
+        except Exception:
+            pass
+
+    if _YLoader is yaml.SafeLoader:
+        print("[WARN] PyYAML was built without LibYAML; using the slower pure-Python loader. "
+              "Reinstall PyYAML with libyaml bindings for faster YAML parsing.")
+
+    yaml_cache_dir = results_dir / _YAML_CACHE_SUBDIR
+
+    # Discover YAML files (top-level only; no subdirectories) in one directory
+    # pass; .yaml and .yml files are ordered together by file name.
+    with os.scandir(runs_dir) as it:
+        yaml_paths: List[pathlib.Path] = sorted(
+            (pathlib.Path(e.path) for e in it
+             if e.name.endswith((".yaml", ".yml")) and e.is_file()),
+            key=lambda p: p.name,
+        )
+
+    # Parse every YAML once (in parallel for larger batches)
+    _preload_cfgs(yaml_paths, yaml_cache_dir)
 
     # Prepare list for the "Runs that will execute" banner
     run_items_preview: List[Tuple[str, str]] = []
     for ypath in yaml_paths:
         try:
-            with ypath.open("r", encoding="utf-8") as fh:
-                cfg = yaml.safe_load(fh) or {}
-            run_name = _safe_get(cfg, ["run", "identification", "name"], ypath.stem)
+            cfg = _load_cfg(ypath, yaml_cache_dir)
+            run_name = _get_run_ident(cfg, "name", ypath.stem)
             run_items_preview.append((str(run_name), ypath.name))
         except Exception:
             run_items_preview.append((ypath.stem, ypath.name))
@@ -497,50 +749,49 @@ def main(argv: Optional[List[str]] = None) -> int:
     for ypath in yaml_paths:
         # Load YAML (full document; we only pluck required parts)
         try:
-            with ypath.open("r", encoding="utf-8") as fh:
-                cfg = yaml.safe_load(fh) or {}
+            cfg = _load_cfg(ypath, yaml_cache_dir)
         except Exception as e:
             print(f"[ERROR] Failed to parse YAML '{ypath.name}': {e}")
             # Keep batch running: continue with next file.
             continue
 
         # Determine run_id exactly from YAML name (no timestamp)
-        run_name = _safe_get(cfg, ["run", "identification", "name"], None)
+        run_name = _get_run_ident(cfg, "name", None)
         run_id = str(run_name).strip() if isinstance(run_name, str) and run_name.strip() else ypath.stem
 
         # Ensure per-run results mirror folders
         run_out_dir = results_dir / run_id
         _ensure_dir(run_out_dir)
-        _ensure_dir(run_out_dir / _settings.TOP_SUBDIR_REPORTS)
-        _ensure_dir(run_out_dir / _settings.TOP_SUBDIR_PLOTS)
+        _ensure_dir(run_out_dir / _S.reports_subdir)
+        _ensure_dir(run_out_dir / _S.plots_subdir)
 
         # Snapshot the exact YAML into results/<run_id>/ (keep original filename)
         try:
-            shutil.copy2(ypath, run_out_dir / ypath.name)
+            _fast_copy(ypath, run_out_dir / ypath.name)
         except Exception as e:
             print(f"[ERROR] Failed to snapshot YAML '{ypath.name}': {e}")
 
         # Global seed: YAML > settings default/random
-        yaml_seed = _safe_get(cfg, ["run", "identification", "seed"], None)
+        yaml_seed = _get_run_ident(cfg, "seed", None)
         if yaml_seed is None:
-            global_seed = _settings.DEFAULT_GLOBAL_SEED if _settings.DEFAULT_GLOBAL_SEED is not None else random.getrandbits(64)
+            global_seed = _S.default_seed if _S.default_seed is not None else random.getrandbits(64)
         else:
             global_seed = int(yaml_seed)
 
         # Serial params (authoritative from top settings for now)
-        dev = _settings.DEFAULT_SEM_DEVICE
-        baud = _settings.DEFAULT_BAUDRATE
+        dev = _S.sem_device
+        baud = _S.baudrate
 
         # Area/time profile names from the YAML (full YAML is accepted)
-        area_prof = _safe_get(cfg, ["general", "fault_injection", "area_profile"], "address_list")
-        time_prof = _safe_get(cfg, ["general", "fault_injection", "time_profile"], "uniform")
+        area_prof = _get_fi_general(cfg, "area_profile", "address_list")
+        time_prof = _get_fi_general(cfg, "time_profile", "uniform")
 
         # Build area/time argument CSVs from specifics
         area_csv, _ = _build_area_args(cfg, area_prof, global_seed)
         time_csv, _ = _build_time_args(cfg, time_prof)
 
         # Session label (stable default)
-        session_label = _settings.DEFAULT_SESSION_LABEL
+        session_label = _S.session_label
 
         # Compose the FI CLI (pass top-layer authoritative defaults explicitly)
         fi_cmd: List[str] = [
@@ -570,35 +821,25 @@ def main(argv: Optional[List[str]] = None) -> int:
         try:
             # The defines driver writes to a final directory and may also mirror to results.
             # Older versions accepted --outdir; newer accept --final-dir and copy flags.
-            final_dir = pathlib.Path(getattr(_settings, "DEFINES_FINAL_PATH", ".")).resolve()
+            final_dir = pathlib.Path(_S.defs_final_path).resolve()
 
             # Compute results mirror directory for defines/pblocks artifacts (used below to locate TCL).
-            defs_outdir = (results_dir / run_id / getattr(_settings, "DEFINES_RESULTS_SUBDIR", "gen")).resolve()
+            defs_outdir = (results_dir / run_id / _S.defs_subdir).resolve()
 
             # Extract values to pass downstream as simple CLI strings (avoid handing off the YAML).
             try:
-                area_prof = str(_safe_get(cfg, ["general", "fault_injection", "area_profile"], "")).strip().lower()
+                area_prof = str(_get_fi_general(cfg, "area_profile", "")).strip().lower()
             except Exception:
                 area_prof = ""
             try:
                 board = str(_safe_get(cfg, ["run", "hardware", "board"], "")).strip()
             except Exception:
                 board = ""
+            # Compact CSV containing only enabled target labels.
             try:
-                targets_map = (_safe_get(cfg, ["specifics", "fault_injection", "area", "modules", "targets"], {}) or {})
-                if not targets_map:
-                    targets_map = (_safe_get(cfg, ["specifics", "fault_injection", "area", "module", "targets"], {}) or {})
+                enabled_csv = ",".join(_enabled_labels(cfg))
             except Exception:
-                targets_map = {}
-
-            # Build a compact CSV containing only enabled target labels.
-            enabled_labels = []
-            if isinstance(targets_map, dict):
-                for name, val in targets_map.items():
-                    v = (str(val).strip().lower() if not isinstance(val, bool) else ("on" if val else "off"))
-                    if v in ("on", "true", "1", "yes"):
-                        enabled_labels.append(str(name))
-            enabled_csv = ",".join(sorted(set(enabled_labels)))
+                enabled_csv = ""
 
             # Call the defines generator passing strings only; no temporary handoff files are created.
             defs_cmd = [
@@ -611,11 +852,15 @@ def main(argv: Optional[List[str]] = None) -> int:
                 "--run-id", str(run_id),
                 "--final-dir", str(final_dir),
             ]
-            if bool(getattr(_settings, "DEFINES_COPY_TO_RESULTS", True)):
+            if _S.defs_copy:
                 defs_cmd.append("--copy-to-results")
             else:
                 defs_cmd.append("--no-copy-to-results")
-            rc = subprocess.run(defs_cmd, cwd=str(_THIS_DIR), text=True, capture_output=True)
+            # Only keep the generator's stdout when asked to; stderr is enough
+            # to diagnose a failure and avoids buffering a large log in memory.
+            sub_out = subprocess.PIPE if _S.subprocess_verbose else subprocess.DEVNULL
+            rc = subprocess.run(defs_cmd, cwd=str(_THIS_DIR), text=True,
+                                stdout=sub_out, stderr=subprocess.PIPE)
             if rc.returncode != 0:
                 print("[WARN] Defines/pblocks generation returned non-zero:")
                 if rc.stdout: print(rc.stdout)
@@ -631,20 +876,21 @@ def main(argv: Optional[List[str]] = None) -> int:
                 ]
                 tcl_path = next((p for p in tcl_candidates if p.exists()), None)
                 if tcl_path is not None:
-                    if bool(getattr(_settings, "APPLY_PBLOCKS_TCL", False)):
-                        vbin = str(getattr(_settings, "VIVADO_BIN", "vivado"))
+                    if _S.apply_tcl:
+                        vbin = _S.vivado_bin
                         vlog = (results_dir / run_id / "vivado_pblocks.log").resolve()
                         vjou = (results_dir / run_id / "vivado_pblocks.jou").resolve()
                         env = os.environ.copy()
-                        xpr = getattr(_settings, "VIVADO_XPR", None)
+                        xpr = _S.vivado_xpr
                         if xpr:
                             env["FATORI_XPR"] = str(pathlib.Path(xpr).resolve())
                         vcmd = [vbin, "-mode", "batch", "-source", str(tcl_path), "-notrace",
                                 "-log", str(vlog), "-journal", str(vjou)]
                         print(f"[INFO] Applying pblocks in Vivado: {' '.join(vcmd)}")
-                        vrc = subprocess.run(vcmd, cwd=str(_THIS_DIR), text=True, capture_output=True, env=env)
+                        vrc = subprocess.run(vcmd, cwd=str(_THIS_DIR), text=True,
+                                             stdout=sub_out, stderr=subprocess.PIPE, env=env)
                         if vrc.returncode != 0:
-                            print("[WARN] Vivado pblocks apply returned non-zero.")
+                            print(f"[WARN] Vivado pblocks apply returned non-zero (see {vlog}).")
                             if vrc.stdout: print(vrc.stdout)
                             if vrc.stderr: print(vrc.stderr)
                         else:
@@ -658,6 +904,11 @@ def main(argv: Optional[List[str]] = None) -> int:
 
         _print_per_run_header(run_id, ypath.name, str(area_prof), str(time_prof), int(global_seed))
 
+        # FI's stdout is a pipe to the tee below; tell it whether the operator
+        # is on a terminal so console colors follow this process, not the pipe.
+        fi_env = os.environ.copy()
+        fi_env["FATORI_STDOUT_TTY"] = "1" if sys.stdout.isatty() else "0"
+
         # Run FI with cwd at this folder so FI writes ./results/
         try:
             proc = subprocess.Popen(
@@ -666,8 +917,9 @@ def main(argv: Optional[List[str]] = None) -> int:
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                text=False,
+                bufsize=0,                       # raw pipes; _tee_and_autofinish frames lines
+                env=fi_env,
             )
         except Exception as e:
             print(f"[ERROR] Failed to start FI: {e}")
@@ -48,6 +48,10 @@ DEFINES_FINAL_PATH: str = "."
 DEFINES_COPY_TO_RESULTS: bool = True
 # Subdirectory name under results/<run_id> to store the mirrored headers.
 DEFINES_RESULTS_SUBDIR: str = "gen"
+# If True, the stdout of the defines generator (and of the optional Vivado
+# pblocks step) is captured and echoed. When False it is discarded and only
+# stderr is kept for diagnostics on failure.
+SUBPROCESS_VERBOSE: bool = False
 
 # --- Serial defaults (authoritative at the top layer) ------------------------
 DEFAULT_SEM_DEVICE: str = "/dev/ttyUSB0"
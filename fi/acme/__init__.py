@@ -26,16 +26,21 @@
 #     fresh list is generated.
 #   • If a cache file exists but contains zero lines, it is automatically
 #     discarded and rebuilt. This avoids stale-empty caches after parser changes.
+#   • A cache is reused only while its .meta.json sidecar matches the EBD
+#     (stat fast path, content digest fallback; see acme_cache.py).
 # =============================================================================
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
-from typing import Iterator, Tuple
+from typing import Dict, Iterator, Optional, Tuple
 
-from .acme_core import parse_ebd_to_lfas
-from .acme_cache import cached_device_path
+from .acme_core import parse_ebd_to_lfas, iter_mapped_lines
+from .acme_cache import (
+    cached_device_path, cache_is_fresh, snapshot_ebd_meta, write_cache_meta, remove_cache_meta,
+)
 from .acme_xcku040 import Xcku040Board
 from .acme_basys3 import Basys3Board
 
@@ -61,14 +66,53 @@ def load_board(name: str):
 
 
 # ------------------------------ debug helpers --------------------------------
+@functools.lru_cache(maxsize=None)
 def _env_truthy(var_name: str, default: bool = False) -> bool:
-    """True if env var is one of: 1, true, yes, on (case-insensitive)."""
+    """
+    True if env var is one of: 1, true, yes, on (case-insensitive).
+    Resolved once per process; call _env_truthy.cache_clear() after changing
+    the environment at runtime.
+    """
     val = os.environ.get(var_name, "")
     if not val:
         return default
     return str(val).strip().lower() in ("1", "true", "yes", "on")
 
 
+_LFA_HEX = b"0123456789ABCDEFabcdef"
+
+
+def count_cache_records(path: str | Path) -> int:
+    """
+    Count valid LFA records (one 10-hex LFA per line, surrounding whitespace
+    ignored) in a cache file, reading 1 MiB blocks. Blank or malformed lines
+    are not counted, so the result matches what a line-validating reader
+    will actually serve.
+    """
+    def _ok(s: bytes) -> bool:
+        return len(s) == 10 and not s.translate(None, _LFA_HEX)
+
+    n = 0
+    tail = b""
+    with Path(path).open("rb") as fh:
+        for buf in iter(lambda: fh.read(1 << 20), b""):
+            lines = (tail + buf).split(b"\n")
+            tail = lines.pop()
+            n += sum(map(_ok, map(bytes.strip, lines)))
+    return n + _ok(tail.strip())
+
+
+if hasattr(int, "bit_count"):  # Python 3.10+
+    _popcount = int.bit_count
+else:
+    def _popcount(v: int) -> int:
+        return bin(v).count("1")
+
+
+# Payload rows per popcount batch in scan_ebd_payload_stats (~256 KiB of bits).
+_POPCOUNT_BATCH = 8192
+
+
 def scan_ebd_payload_stats(ebd_path: str | Path) -> Tuple[int, int, int]:
     """
     Lightweight pre-scan to help diagnose empty-device situations.
@@ -83,7 +127,10 @@ def scan_ebd_payload_stats(ebd_path: str | Path) -> Tuple[int, int, int]:
 
     Notes
     -----
-    • Streaming scan; trailing partial (<32-bit) chunks are ignored.
+    • The file is memory-mapped and scanned in large windows; every per-row
+      step (match, strip whitespace) runs in C on bytes objects, and the
+      complete words of many rows are parsed as one integer and popcounted.
+      Trailing partial (<32-bit) chunks are ignored.
     • Mirrors the parser’s treatment of payload rows.
     """
     from re import compile as _re
@@ -91,29 +138,37 @@ def scan_ebd_payload_stats(ebd_path: str | Path) -> Tuple[int, int, int]:
     payload_rows = 0
     full_words = 0
     ones = 0
-    re_payload = _re(r"^[01\s\t]+$")
-    with p.open("r", encoding="utf-8", errors="ignore") as fh:
-        for raw in fh:
-            line = raw.strip()
-            if not line:
-                continue
-            if re_payload.match(line):
-                payload_rows += 1
-                bits = "".join(ch for ch in line if ch in "01")
-                n_full = len(bits) // 32
-                full_words += n_full
-                if "1" in bits:
-                    for i in range(n_full):
-                        chunk = bits[i * 32 : (i + 1) * 32]
-                        if "1" in chunk:
-                            ones += chunk.count("1")
+    re_payload = _re(rb"[01 \t\r\x0b\x0c]+").fullmatch
+    ws = b" \t\r\x0b\x0c"
+    # Complete words are batched and popcounted as one big integer per batch:
+    # one int() parse + one bit_count() per _POPCOUNT_BATCH rows.
+    pending: list[bytes] = []
+    for line in iter_mapped_lines(p):
+        if not line or not re_payload(line):
+            continue
+        bits = line.translate(None, ws)
+        if not bits:
+            continue  # whitespace-only line
+        payload_rows += 1
+        n_full = len(bits) // 32
+        full_words += n_full
+        if n_full:
+            pending.append(bits[: n_full * 32])
+            if len(pending) >= _POPCOUNT_BATCH:
+                ones += _popcount(int(b"".join(pending), 2))
+                pending.clear()
+    if pending:
+        ones += _popcount(int(b"".join(pending), 2))
     return payload_rows, full_words, ones
 
 
 # ------------------------------ device extract -------------------------------
-def extract_device_addresses(ebd_path: str | Path, board) -> Iterator[str]:
-    """Stream SEM LFAs (10-hex strings) parsed from an EBD file."""
-    return parse_ebd_to_lfas(ebd_path, board)
+def extract_device_addresses(ebd_path: str | Path, board, stats: Optional[Dict[str, int]] = None) -> Iterator[str]:
+    """
+    Stream SEM LFAs (10-hex strings) parsed from an EBD file. If 'stats' is a
+    dict it receives the payload counters once the stream is exhausted.
+    """
+    return parse_ebd_to_lfas(ebd_path, board, stats)
 
 
 def get_or_build_cached_device_list(
@@ -129,7 +184,8 @@ def get_or_build_cached_device_list(
     Debug (FI_ACME_DEBUG)
     ---------------------
     Prints: EBD path and size; payload stats; first few LFAs emitted (N controlled
-    by FI_ACME_DEBUG_N; default 5).
+    by FI_ACME_DEBUG_N; default 5). On a rebuild the payload stats are
+    collected by the parser itself, so the EBD is read only once.
     """
     ebd_path = Path(ebd_path)
     cache_path = cached_device_path(ebd_path=ebd_path, board_name=board_name, cache_dir=cache_dir)
@@ -144,11 +200,9 @@ def get_or_build_cached_device_list(
             print(f"[DEBUG][ACME] EBD: {ebd_path} — size={stat.st_size} bytes")
         except Exception:
             print(f"[DEBUG][ACME] EBD: {ebd_path} — <stat failed>")
-        pr, fw, ones = scan_ebd_payload_stats(ebd_path)
-        print(f"[DEBUG][ACME] payload_rows={pr}, full_32bit_words={fw}, ones_bits={ones}")
 
-    # Fast path: reuse cache unless forced to rebuild or file is empty
-    if cache_path.exists() and not force_rebuild:
+    # Fast path: reuse cache unless forced to rebuild, stale, or file is empty
+    if cache_path.exists() and not force_rebuild and cache_is_fresh(cache_path=cache_path, ebd_path=ebd_path):
         try:
             with cache_path.open("r", encoding="utf-8", errors="ignore") as fh:
                 # Peek two lines: 0 -> empty file; 1+ -> usable
@@ -160,11 +214,13 @@ def get_or_build_cached_device_list(
 
         if has_data:
             if debug:
+                pr, fw, ones = scan_ebd_payload_stats(ebd_path)
+                print(f"[DEBUG][ACME] payload_rows={pr}, full_32bit_words={fw}, ones_bits={ones}")
                 try:
-                    n_lines = sum(1 for _ in cache_path.open("r", encoding="utf-8", errors="ignore"))
+                    n_records = count_cache_records(cache_path)
                 except Exception:
-                    n_lines = -1
-                print(f"[DEBUG][ACME] cache hit: {cache_path} (lines={n_lines})")
+                    n_records = -1
+                print(f"[DEBUG][ACME] cache hit: {cache_path} (records={n_records})")
             return cache_path
         else:
             # Stale/empty cache — remove and rebuild
@@ -177,18 +233,47 @@ def get_or_build_cached_device_list(
 
     board = load_board(board_name)
     cache_path.parent.mkdir(parents=True, exist_ok=True)
+    remove_cache_meta(cache_path)  # an interrupted rebuild must not look valid
+
+    # Snapshot the EBD before parsing: the sidecar must describe the bytes
+    # the cache was built from, not whatever is on disk once the build ends.
+    try:
+        ebd_meta: Optional[dict] = snapshot_ebd_meta(ebd_path)
+    except Exception:
+        ebd_meta = None  # cache is still written, but rebuilt next time
 
     emitted = 0
     samples: list[str] = []
+    stats: Optional[Dict[str, int]] = {} if debug else None
 
-    with cache_path.open("w", encoding="utf-8") as fh:
-        for lfa in extract_device_addresses(ebd_path, board):
-            fh.write(lfa + "\n")
+    # LFAs are batched into a bytearray and flushed per ~1 MiB, so a device
+    # with millions of essential bits costs a few hundred writes, not millions.
+    # The list is written next to the cache and renamed over it when complete:
+    # the cache file is never modified in place, so hard links to an older
+    # version (see fi/area/device.py) keep their content.
+    buf = bytearray()
+    flush_at = 1 << 20
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with tmp_path.open("wb", buffering=flush_at) as fh:
+        for lfa in extract_device_addresses(ebd_path, board, stats):
+            buf += lfa.encode("ascii")
+            buf += b"\n"
             emitted += 1
             if debug and len(samples) < max(0, debug_n):
                 samples.append(lfa)
+            if len(buf) >= flush_at:
+                fh.write(buf)
+                buf.clear()
+        if buf:
+            fh.write(buf)
+    os.replace(tmp_path, cache_path)
 
     if debug:
+        print(
+            f"[DEBUG][ACME] payload_rows={stats.get('payload_rows', 0)}, "
+            f"full_32bit_words={stats.get('full_32bit_words', 0)}, "
+            f"ones_bits={stats.get('ones_bits', 0)}"
+        )
         print(f"[DEBUG][ACME] emitted={emitted} LFAs → {cache_path}")
         if samples:
             print("[DEBUG][ACME] first LFAs:", ", ".join(samples))
@@ -199,6 +284,12 @@ def get_or_build_cached_device_list(
             cache_path.unlink()
         except Exception:
             pass
+        remove_cache_meta(cache_path)
+    elif ebd_meta is not None:
+        try:
+            write_cache_meta(cache_path=cache_path, meta=ebd_meta)
+        except Exception:
+            remove_cache_meta(cache_path)  # unvalidated cache is rebuilt next time
 
     return cache_path
 
@@ -209,4 +300,5 @@ __all__ = [
     "extract_device_addresses",
     "get_or_build_cached_device_list",
     "scan_ebd_payload_stats",
+    "count_cache_records",
 ]
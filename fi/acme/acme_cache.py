@@ -16,24 +16,48 @@
 #   • Callers may override the base cache directory by passing 'cache_dir'.
 #
 # Filename scheme
-#   • <board>__<ebd_basename>__<bytes>__<mtimehex>__<pathhash8>.txt
+#   • <board>__<ebd_basename>__<pathhash8>.txt
 #       - board        : lowercased board key (e.g., xcku040, basys3)
 #       - ebd_basename : original EBD filename (sanitized)
-#       - bytes        : file size in bytes
-#       - mtimehex     : file mtime encoded as hex integer (seconds resolution)
 #       - pathhash8    : 8-hex hash of the absolute path to disambiguate copies
 #
+# Validation
+#   • Next to each cache file sits <cache>.meta.json with the EBD's
+#     {mtime_ns, size, ino, digest}. A matching stat triple reuses the cache
+#     without reading the EBD. If the stat changed, the EBD content is hashed
+#     (xxh3_64 when the 'xxhash' package is installed, else blake2b) in
+#     128 KiB reads; an unchanged digest still reuses the cache and refreshes
+#     the stored stat so the next lookup is stat-only again.
+#   • The metadata is snapshotted before the EBD is parsed and written after
+#     the cache is complete, so it always describes the content that was read.
+#   • Within one process, a cache already validated is remembered together
+#     with the sidecar's mtime; later lookups then cost two stat() calls and
+#     skip reading the sidecar entirely.
+#
 # Notes
-#   • This module computes paths only; directory creation and file I/O are done
-#     by the caller (see fi/acme/__init__.py).
+#   • cached_device_path() computes paths only; directory creation and the
+#     cache file itself are handled by the caller (see fi/acme/__init__.py).
 # =============================================================================
 
 from __future__ import annotations
 
 import hashlib
+import json
 import re
 from pathlib import Path
 
+try:
+    import xxhash  # optional, faster content digest
+except Exception:
+    xxhash = None
+
+_HASH_CHUNK = 128 * 1024
+
+# Per-process record of caches already validated: str(cache_path) ->
+# (EBD stat triple, meta file mtime_ns). Lets repeated lookups in one process
+# skip even the sidecar read while neither file has changed.
+_FRESH_SEEN: dict[str, tuple] = {}
+
 
 def _sanitize(name: str) -> str:
     """Make a filename-friendly token (letters, digits, '-', '_', '.')."""
@@ -58,15 +82,6 @@ def cached_device_path(*, ebd_path: str | Path, board_name: str, cache_dir: str
     # Default cache root lives under the repository, away from human-facing results
     base = Path(cache_dir) if cache_dir else Path("fi") / "build" / "acme"
 
-    try:
-        st = ebd.stat()
-        size = st.st_size
-        mtime = int(st.st_mtime)
-    except Exception:
-        # If stat fails, still create a stable-ish name
-        size = 0
-        mtime = 0
-
     # Include absolute path in the hash to disambiguate same-named copies
     try:
         abs_s = str(ebd.resolve())
@@ -77,8 +92,104 @@ def cached_device_path(*, ebd_path: str | Path, board_name: str, cache_dir: str
     fname = (
         f"{_sanitize(board_name.lower())}"
         f"__{_sanitize(ebd.name)}"
-        f"__{size}"
-        f"__{mtime:08X}"
         f"__{h}.txt"
     )
     return base / fname
+
+
+def _meta_path(cache_path: Path) -> Path:
+    return cache_path.with_name(cache_path.name + ".meta.json")
+
+
+def _content_digest(ebd: Path) -> str:
+    """Hex digest of the EBD content, read in 128 KiB chunks."""
+    hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    algo = "xxh3_64" if xxhash is not None else "blake2b"
+    buf = bytearray(_HASH_CHUNK)
+    view = memoryview(buf)
+    with ebd.open("rb", buffering=0) as fh:
+        while True:
+            n = fh.readinto(buf)
+            if not n:
+                break
+            hasher.update(view[:n])
+    return f"{algo}:{hasher.hexdigest()}"
+
+
+def cache_is_fresh(*, cache_path: str | Path, ebd_path: str | Path) -> bool:
+    """
+    True if cache_path was built from the current content of ebd_path.
+
+    Uses the stat triple (mtime_ns, size, inode) as the fast path and falls
+    back to a content digest only when it differs. Missing or unreadable
+    metadata counts as stale.
+    """
+    cache_path = Path(cache_path)
+    ebd = Path(ebd_path)
+    meta_p = _meta_path(cache_path)
+    try:
+        st = ebd.stat()
+        meta_mtime = meta_p.stat().st_mtime_ns
+    except Exception:
+        return False
+    triple = (st.st_mtime_ns, st.st_size, st.st_ino)
+    memo_key = str(cache_path)
+    if _FRESH_SEEN.get(memo_key) == (triple, meta_mtime):
+        return True
+
+    try:
+        meta = json.loads(meta_p.read_text(encoding="utf-8"))
+    except Exception:
+        return False
+
+    if (meta.get("mtime_ns"), meta.get("size"), meta.get("ino")) == triple:
+        _FRESH_SEEN[memo_key] = (triple, meta_mtime)
+        return True
+    if meta.get("size") != st.st_size:
+        return False  # content cannot match; skip hashing
+
+    try:
+        digest = _content_digest(ebd)
+    except Exception:
+        return False
+    if digest != meta.get("digest"):
+        return False
+
+    # Same content under a new stat (touch, copy, rename-in-place): remember it.
+    meta.update(mtime_ns=st.st_mtime_ns, size=st.st_size, ino=st.st_ino)
+    try:
+        meta_p.write_text(json.dumps(meta), encoding="utf-8")
+        _FRESH_SEEN[memo_key] = (triple, meta_p.stat().st_mtime_ns)
+    except Exception:
+        pass
+    return True
+
+
+def snapshot_ebd_meta(ebd_path: str | Path) -> dict:
+    """
+    Stat triple and content digest of ebd_path, as stored by write_cache_meta().
+    Take it before parsing the EBD, so an edit made during the build leaves
+    the cache looking stale rather than validated against the new content.
+    """
+    ebd = Path(ebd_path)
+    st = ebd.stat()
+    return {
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "ino": st.st_ino,
+        "digest": _content_digest(ebd),
+    }
+
+
+def write_cache_meta(*, cache_path: str | Path, meta: dict) -> None:
+    """Record a snapshot_ebd_meta() result next to cache_path."""
+    _meta_path(Path(cache_path)).write_text(json.dumps(meta), encoding="utf-8")
+
+
+def remove_cache_meta(cache_path: str | Path) -> None:
+    """Drop the metadata sidecar of cache_path, if any."""
+    _FRESH_SEEN.pop(str(cache_path), None)
+    try:
+        _meta_path(Path(cache_path)).unlink()
+    except Exception:
+        pass
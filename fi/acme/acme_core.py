@@ -34,10 +34,11 @@
 
 from __future__ import annotations
 
+import mmap
 import os
 import re
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Dict, Iterator, Optional
 
 
 # --------------------------- helpers: packing --------------------------------
@@ -63,6 +64,43 @@ def _pack_lfa(la: int, word: int, bit: int) -> str:
     return f"{val:010X}"
 
 
+# --------------------------- helpers: file access ---------------------------
+
+# Window size for mapped scans; each window is split into lines in one C call.
+_MAP_WINDOW = 8 << 20
+
+
+def iter_mapped_lines(path: str | Path) -> Iterator[bytes]:
+    """
+    Yield the lines of 'path' (without terminators) from a read-only mmap.
+
+    The file is consumed in ~8 MiB windows cut at newline boundaries, and each
+    window is split with bytes.splitlines(). Pages come straight from the OS
+    cache, no read() copy of the whole file is made, and peak extra memory is
+    bounded by one window regardless of EBD size.
+    """
+    with open(path, "rb") as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # empty file: nothing to map
+        with mm:
+            size = len(mm)
+            pos = 0
+            while pos < size:
+                end = min(pos + _MAP_WINDOW, size)
+                if end < size:
+                    nl = mm.rfind(b"\n", pos, end)
+                    if nl >= pos:
+                        end = nl + 1
+                    else:
+                        # Line longer than a window: extend to its end.
+                        nl = mm.find(b"\n", end)
+                        end = size if nl < 0 else nl + 1
+                yield from mm[pos:end].splitlines()
+                pos = end
+
+
 # ----------------------------- EBD parsing -----------------------------------
 
 # Accept a standalone 10-hex token (already an LFA)
@@ -136,16 +174,24 @@ def _emit_word_bits(la: int, word: int, word_bits: str) -> Iterator[str]:
     """
     Emit LFAs for every '1' in a 32-character string of '0'/'1'.
     Interprets the string MSB→LSB; thus BIT = 31 - column_index.
+
+    The word is parsed once into an int and only its set bits are visited
+    (highest first, i.e. the same left-to-right column order as the text),
+    so sparse essential-bit words cost one step per '1' instead of 32.
+    LA/WORD come from the WF mapping and are in range by construction, so
+    the LFA is formatted directly rather than through _pack_lfa's checks.
     """
     if "1" not in word_bits:
         return
-    for col, ch in enumerate(word_bits):
-        if ch == "1":
-            bit = 31 - col
-            yield _pack_lfa(la, word, bit)
+    w = int(word_bits, 2)
+    base = (la << 12) | (word << 5)
+    while w:
+        bit = w.bit_length() - 1
+        yield f"{base | bit:010X}"
+        w ^= 1 << bit
 
 
-def parse_ebd_to_lfas(ebd_path: str | Path, board) -> Iterator[str]:
+def parse_ebd_to_lfas(ebd_path: str | Path, board, stats: Optional[Dict[str, int]] = None) -> Iterator[str]:
     """
     Parse an EBD text file and yield SEM LFAs (10-hex strings) for *all*
     essential bits described within.
@@ -164,6 +210,9 @@ def parse_ebd_to_lfas(ebd_path: str | Path, board) -> Iterator[str]:
       For every '1' bit, an LFA is emitted.
     • Non-matching lines (headers) are ignored and do not increment W.
     • The function is streaming; it does not load the entire file in memory.
+    • If 'stats' is a dict, it is filled during the same pass with
+      payload_rows, full_32bit_words and ones_bits (the counters of
+      scan_ebd_payload_stats), so callers need no second scan of the file.
 
     Debug
     -----
@@ -185,6 +234,9 @@ def parse_ebd_to_lfas(ebd_path: str | Path, board) -> Iterator[str]:
         raise ValueError("Invalid board.WF; expected 1..128")
 
     word_index = 0  # counts only 32-bit payload words
+    payload_rows = 0
+    ones_bits = 0
+    want_stats = stats is not None
 
     # Debug knobs
     dbg_enabled = str(os.environ.get("FI_ACME_DEBUG", "")).strip().lower() in ("1", "true", "yes", "on")
@@ -215,6 +267,9 @@ def parse_ebd_to_lfas(ebd_path: str | Path, board) -> Iterator[str]:
 
             # Lines that contain only 0/1 (spaces allowed) are payload carriers
             if _RE_BIN32.match(line):
+                if want_stats:
+                    payload_rows += 1
+                    ones_bits += line.count("1")
                 la = word_index // wf
                 word = word_index % wf
                 # Gather a few sample LFAs for debug if there are '1's
@@ -239,6 +294,9 @@ def parse_ebd_to_lfas(ebd_path: str | Path, board) -> Iterator[str]:
                 bits = "".join(ch for ch in line if ch in "01")
                 # Split into 32-bit chunks; ignore any trailing remainder
                 n_full = len(bits) // 32
+                if want_stats:
+                    payload_rows += 1
+                    ones_bits += bits.count("1", 0, n_full * 32)
                 for i in range(n_full):
                     chunk = bits[i * 32 : (i + 1) * 32]
                     la = word_index // wf
@@ -260,3 +318,8 @@ def parse_ebd_to_lfas(ebd_path: str | Path, board) -> Iterator[str]:
                 continue
 
             # Ignore any other headers/lines
+
+    if want_stats:
+        stats["payload_rows"] = payload_rows
+        stats["full_32bit_words"] = word_index
+        stats["ones_bits"] = ones_bits
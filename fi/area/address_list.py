@@ -13,6 +13,7 @@
 #   • describe() -> str            : human-readable summary of the active configuration.
 #   • next_address() -> str|None   : next LFA (uppercase 10-hex) or None when exhausted.
 #   • iter_addresses() -> Iterable : enumerates remaining LFAs from the current cursor.
+#   • drain_into(out) -> int       : appends all remaining LFAs to a list in one step.
 #   • __iter__()                   : alias to iter_addresses().
 #   • reset()                      : rewinds the internal cursor to the beginning.
 #   • end_condition_prompt(reason) : returns a short, human-readable end message for a given reason.
@@ -29,7 +30,7 @@ from typing import Iterable, List, Optional, Dict, Any
 import os
 import re
 
-from fi.area.base import load_addresses_file, apply_ordering
+from fi.area.base import load_addresses_file, apply_ordering, pack_lfas, lfa_at, LFA_WIDTH
 
 
 # --- end-condition message dictionary (hardcoded) -----------------------------
@@ -38,6 +39,19 @@ _END_MESSAGES = {
 }
 
 _HEX10_RE = re.compile(r'^[0-9A-Fa-f]{10}$')
+_HEX_BYTES = b"0123456789ABCDEF"
+
+
+def _all_hex10(lines: List[str]) -> bool:
+    """
+    Bulk check that every entry is exactly 10 uppercase hex digits. Runs as a handful
+    of C-level passes (len map, one join, one translate) instead of one regex
+    call per line; the per-line regex is only used to locate an error.
+    """
+    if any(n != 10 for n in set(map(len, lines))):
+        return False
+    joined = "".join(lines)
+    return joined.isascii() and not joined.encode("ascii").translate(None, _HEX_BYTES)
 
 
 def _norm_keys(d: Dict[str, Any]) -> Dict[str, Any]:
@@ -76,16 +90,15 @@ class Profile:
         if not os.path.isfile(path):
             raise ValueError(f"address_list: file not found: {path}")
 
-        # Load raw lines using the shared loader; ignore blanks and '#'-comments.
-        raw_addrs: List[str] = load_addresses_file(path)
+        # Load lines using the shared loader (blanks and '#'-comments dropped),
+        # uppercasing in the same pass.
+        addrs: List[str] = load_addresses_file(path, transform=str.upper)
 
-        # Validate format and normalize to uppercase 10-hex strings.
-        addrs: List[str] = []
-        for idx, line in enumerate(raw_addrs, start=1):
-            s = line.strip()
-            if not _HEX10_RE.match(s):
-                raise ValueError(f"address_list: invalid LFA at line {idx}: '{line}' (expected 10 hexadecimal digits)")
-            addrs.append(s.upper())
+        # Validate format: every entry must be 10 hex digits.
+        if not _all_hex10(addrs):
+            for idx, line in enumerate(addrs, start=1):
+                if not _HEX10_RE.match(line):
+                    raise ValueError(f"address_list: invalid LFA at line {idx}: '{line}' (expected 10 hexadecimal digits)")
 
         # Determine selection mode: accept 'mode' or legacy 'order'.
         # Allowed values: 'sequential' or 'random'. Legacy alias: order='shuffle' -> 'random'.
@@ -115,8 +128,9 @@ class Profile:
         base_order = "shuffle" if canonical_mode == "random" else "sequential"
         ordered = apply_ordering(addrs, order=base_order, seed=seed)
 
-        # Internal storage and cursor.
-        self._addrs: List[str] = ordered
+        # Internal storage (packed 10-byte records) and cursor.
+        self._blob: bytes = pack_lfas(ordered)
+        self._n: int = len(ordered)
         self._idx: int = 0
         self._path: str = path
         self._mode: str = canonical_mode
@@ -125,7 +139,7 @@ class Profile:
     # ---------- public API -----------------------------------------------------
     def describe(self) -> str:
         """Concise human-readable description for banners/log headers."""
-        n = len(self._addrs)
+        n = self._n
         seed_str = f", seed={self._seed}" if (self._seed is not None and self._mode == "random") else ""
         return f"address_list: mode={self._mode}, file={os.path.basename(self._path)}, N={n}{seed_str}"
 
@@ -134,19 +148,40 @@ class Profile:
         Return the next LFA (10-hex, uppercase) or None when the list is exhausted.
         Advances the internal cursor by one on each successful call.
         """
-        if self._idx >= len(self._addrs):
+        if self._idx >= self._n:
             return None
-        out = self._addrs[self._idx]
+        out = lfa_at(self._blob, self._idx)
         self._idx += 1
         return out
 
     def iter_addresses(self) -> Iterable[str]:
         """
         Yield remaining LFAs quickly (no sleeps). This preserves current cursor
-        semantics (starts at current position and advances with each yield).
+        semantics (starts at current position; consumed items stay consumed).
+        The cursor is kept in a local and written back when the generator
+        finishes or is closed, instead of going through next_address() per item.
+        """
+        blob, n, i = self._blob, self._n, self._idx
+        w = LFA_WIDTH
+        try:
+            while i < n:
+                off = i * w
+                i += 1
+                yield blob[off:off + w].decode("ascii")
+        finally:
+            self._idx = i
+
+    def drain_into(self, out: List[str]) -> int:
+        """
+        Append all remaining LFAs to 'out' in one extend() and exhaust the
+        cursor. Returns the number of addresses appended.
         """
-        while self._idx < len(self._addrs):
-            yield self.next_address()
+        w = LFA_WIDTH
+        rest = self._blob[self._idx * w:].decode("ascii")
+        out.extend([rest[j:j + w] for j in range(0, len(rest), w)])
+        k = self._n - self._idx
+        self._idx = self._n
+        return k
 
     def __iter__(self) -> Iterable[str]:
         """Alias to iter_addresses() for convenience."""
@@ -39,9 +39,15 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Protocol, Sequence, Optional
+from typing import Callable, Iterable, List, Protocol, Sequence, Optional
+from itertools import chain, zip_longest
 import random
 
+try:
+    import numpy as _np  # optional; only used when use_numpy=True
+except Exception:
+    _np = None
+
 
 class AreaProfile(Protocol):
     """Structural protocol (for type-checking and documentation)."""
@@ -51,56 +57,94 @@ class AreaProfile(Protocol):
 
 
 # ---------- parsing: shared file loader --------------------------------------
-def load_addresses_file(path: str) -> List[str]:
+def load_addresses_file(path: str, transform: Optional[Callable[[str], str]] = None) -> List[str]:
     """
     Read an address list from 'path' using canonical rules:
       - One token per line (LFA hex preferred; FAR,WORD,BIT allowed).
       - Strip whitespace; ignore empty lines and lines starting with '#'.
-    Returns a new list in deterministic file order.
+    If 'transform' is given (e.g. str.upper) it is mapped over the kept
+    tokens here, so callers need no normalization loop of their own.
+    The file is read once as bytes and split in C; only kept tokens are
+    decoded. Returns a new list in deterministic file order.
     """
-    out: List[str] = []
-    with open(path, "r") as f:
-        for raw in f:
-            s = raw.strip()
-            if not s or s.startswith("#"):
-                continue
-            out.append(s)
+    with open(path, "rb") as f:
+        data = f.read()
+    out: List[str] = [
+        s.decode("utf-8")
+        for s in (ln.strip() for ln in data.splitlines())
+        if s and not s.startswith(b"#")
+    ]
+    if transform is not None:
+        out = list(map(transform, out))
     return out
 
 
 # ---------- ordering: sequential vs shuffle ----------------------------------
-def apply_ordering(addresses: Sequence[str], order: str = "sequential", seed: Optional[int] = None) -> List[str]:
+def apply_ordering(addresses: Sequence[str], order: str = "sequential", seed: Optional[int] = None,
+                   inplace: bool = False, use_numpy: bool = False) -> List[str]:
     """
     Apply the requested order to a sequence of addresses.
 
     order:
       - "sequential" : return a copy preserving input order
-      - "shuffle"    : Fisher-Yates using Random(seed), reproducible per seed
+      - "shuffle"    : Fisher-Yates using Random(seed), reproducible per seed.
+                       With use_numpy=True and NumPy installed, a PCG64
+                       permutation is drawn in C instead (also reproducible
+                       per seed, but a different order).
 
     seed:
       - If None with order="shuffle", a non-deterministic shuffle is performed.
         Prefer providing a seed for reproducibility across runs.
+
+    inplace:
+      - If True and 'addresses' is a list the caller owns, it is returned
+        as-is (sequential) or permuted in place by the Random shuffle,
+        instead of being copied first.
+
+    use_numpy:
+      - Callers pass settings.AREA_SHUFFLE_NUMPY here; this module does not
+        read settings itself.
     """
     order = (order or "sequential").strip().lower()
-    out = list(addresses)
     if order == "shuffle":
+        if use_numpy and _np is not None:
+            perm = _np.random.default_rng(seed).permutation(len(addresses))
+            return [addresses[i] for i in perm.tolist()]
+        out = addresses if inplace and isinstance(addresses, list) else list(addresses)
         rnd = random.Random(seed)
         rnd.shuffle(out)
-    # else: sequential -> already preserved
-    return out
+        return out
+    # else: sequential -> preserve input order
+    return addresses if inplace and isinstance(addresses, list) else list(addresses)
+
+
+# ---------- packed storage: fixed-width LFA records --------------------------
+LFA_WIDTH = 10  # LFAs are 10 hex digits
+
+
+def pack_lfas(addresses: Sequence[str]) -> bytes:
+    """
+    Pack validated 10-hex LFAs into one contiguous ASCII buffer (10 bytes per
+    record, no separators). Record i is blob[i*10:(i+1)*10]. This replaces a
+    list of str objects (~60 bytes each) for large device/address lists.
+    """
+    return "".join(addresses).encode("ascii")
+
+
+def lfa_at(blob: bytes, i: int) -> str:
+    """Return record i of a pack_lfas() buffer as a str."""
+    off = i * LFA_WIDTH
+    return blob[off:off + LFA_WIDTH].decode("ascii")
 
 
 # ---------- list utilities for module profile --------------------------------
 def dedupe_preserve_order(items: Sequence[str]) -> List[str]:
     """Remove duplicates while preserving first occurrence order."""
-    seen = set()
-    out: List[str] = []
-    for it in items:
-        if it in seen:
-            continue
-        seen.add(it)
-        out.append(it)
-    return out
+    # dicts keep insertion order (guaranteed since Python 3.7)
+    return list(dict.fromkeys(items))
+
+
+_RR_PAD_MAX_LISTS = 4  # up to this many lists, round_robin_merge pads with zip_longest
 
 
 def round_robin_merge(lists: Sequence[Sequence[str]]) -> List[str]:
@@ -108,22 +152,19 @@ def round_robin_merge(lists: Sequence[Sequence[str]]) -> List[str]:
     Interleave multiple lists element-by-element (A0,B0,C0,A1,B1,C1,...)
     until all lists are exhausted. Deterministic given input lists.
     """
-    iters = [iter(lst) for lst in lists]
+    if len(lists) <= _RR_PAD_MAX_LISTS:
+        fill = object()  # padding for exhausted lists; never equal to a real item
+        return [x for x in chain.from_iterable(zip_longest(*lists, fillvalue=fill)) if x is not fill]
+
+    # Many lists: padding every exhausted list on every round would cost
+    # O(k * longest). Instead interleave in stages between consecutive
+    # distinct lengths, dropping lists as they run out, so each stage is a
+    # plain zip() over the lists still active.
     out: List[str] = []
-    remaining = len(iters)
-    # Track exhaustion of individual iterators
-    finished = [False] * len(iters)
-    while remaining > 0:
-        progressed = False
-        for idx, it in enumerate(iters):
-            if finished[idx]:
-                continue
-            try:
-                out.append(next(it))
-                progressed = True
-            except StopIteration:
-                finished[idx] = True
-                remaining -= 1
-        if not progressed:
-            break
+    active = list(lists)
+    start = 0
+    for stop in sorted({len(lst) for lst in lists}):
+        active = [lst for lst in active if len(lst) > start]
+        out.extend(chain.from_iterable(zip(*(lst[start:stop] for lst in active))))
+        start = stop
     return out
@@ -9,8 +9,11 @@
 #     file using the ACME adapter (fi.acme). The resulting list is cached as a
 #     plain .txt (one 10-hex LFA per line) for fast reuse across runs.
 #   • Serves addresses sequentially or in a reproducible random order.
+#     Sequential mode streams the cached list from disk instead of loading it.
 #   • Writes a human-friendly copy of the ACME list into the current run’s
-#     results folder so operators can easily find the addresses used.
+#     results folder so operators can easily find the addresses used. The
+#     copy is a hard link when possible (the cache is only ever replaced, not
+#     rewritten), else a reflink on CoW filesystems, else a plain copy.
 #
 # Configuration (CSV key=val via --area-args)
 #   • board       : device/board name (e.g., xcku040, basys3). Required.
@@ -25,6 +28,7 @@
 #   • name                : profile name string.
 #   • describe() -> str   : short human-readable summary for headers/logs.
 #   • next_address()      : iterator yielding one 10-hex LFA per call; None at end.
+#   • close()             : releases the cache file held open in sequential mode.
 #   • end_condition_prompt(reason:str) -> str :
 #       returns a human-readable message for the end condition 'area_exhausted'.
 #       Used by the controller to print/log profile-specific end reasons.
@@ -32,13 +36,44 @@
 
 from __future__ import annotations
 
-import random
+import os
 import shutil
 from pathlib import Path
 from typing import List, Optional
 
 from fi import settings
-from fi.acme import get_or_build_cached_device_list, scan_ebd_payload_stats
+from fi.acme import count_cache_records, get_or_build_cached_device_list, scan_ebd_payload_stats
+from fi.area.base import apply_ordering, pack_lfas, lfa_at, LFA_WIDTH
+
+try:
+    import fcntl  # optional; POSIX only, used for reflink copies
+except Exception:
+    fcntl = None
+
+
+_HEX_DIGITS = b"0123456789ABCDEF"
+_FICLONE = 0x40049409  # Linux ioctl: share extents with another file (btrfs/xfs)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Place src's content at dst: hard link, else reflink, else byte copy."""
+    try:
+        dst.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass  # cross-device, unsupported FS, ...
+    if fcntl is not None:
+        try:
+            with src.open("rb") as fsrc, dst.open("wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
 
 
 class Profile:
@@ -86,36 +121,57 @@ class Profile:
         )
 
         # ---- Read LFAs from cache file (one per line) ------------------------
+        #      Random mode needs the whole list to shuffle: it is slurped as
+        #      bytes and validated with C-level bytes ops (a line is kept iff it
+        #      is 10 chars long and nothing remains once hex digits are
+        #      deleted). Sequential mode streams the file instead; see below.
+        self._fh = None
         addrs: List[str] = []
-        with cache_txt.open("r", encoding="utf-8", errors="ignore") as fh:
-            for raw in fh:
-                s = raw.strip().upper()
-                if len(s) == 10 and all(ch in "0123456789ABCDEF" for ch in s):
-                    addrs.append(s)
+        if self.mode == "random":
+            data = cache_txt.read_bytes().upper()
+            addrs = [
+                s.decode("ascii")
+                for s in (raw.strip() for raw in data.split(b"\n"))
+                if len(s) == 10 and not s.translate(None, _HEX_DIGITS)
+            ]
+            del data
 
         # ---- Pretty copy into results/<run>/<session>/ for operator visibility
-        #      This creates a *copy* named 'acme_injection_addresses.txt' so that
-        #      humans look into results/, while the keyed cache remains in fi/build/acme/.
+        #      This creates a copy (or link) named 'acme_injection_addresses.txt' so
+        #      that humans look into results/, while the keyed cache remains in fi/build/acme/.
         if self.run_name and self.session_label:
             out_dir = Path(getattr(settings, "LOG_DIR", "results")) / self.run_name / self.session_label
             out_dir.mkdir(parents=True, exist_ok=True)
             friendly_txt = out_dir / "acme_injection_addresses.txt"
             try:
-                shutil.copyfile(cache_txt, friendly_txt)
+                _link_or_copy(cache_txt, friendly_txt)
             except Exception:
                 # Silent: if copy fails, injection still proceeds using the cache file
                 pass
 
         # ---- Shuffle if requested -------------------------------------------
         if self.mode == "random" and addrs:
-            rnd = random.Random(self.seed)
-            rnd.shuffle(addrs)
+            addrs = apply_ordering(addrs, order="shuffle", seed=self.seed,
+                                   use_numpy=bool(getattr(settings, "AREA_SHUFFLE_NUMPY", False)))
 
-        self._addrs = addrs
+        if self.mode == "random":
+            # Packed 10-byte records keep large device lists compact and contiguous.
+            self._blob: Optional[bytes] = pack_lfas(addrs)
+            self._n: int = len(addrs)
+        else:
+            # Sequential: nothing is materialized. The cache (written by ACME,
+            # one LFA per line) is read lazily through a 1 MiB buffer; the
+            # count applies the same line validation as _next_streamed(), so
+            # describe() and the empty-device check match what is served.
+            self._blob = None
+            self._n = count_cache_records(cache_txt)
+            if self._n:
+                self._fh = cache_txt.open("rb", buffering=1 << 20)
         self._idx = 0
+        del addrs
 
         # ---- Diagnose empty lists with actionable detail ---------------------
-        if not self._addrs:
+        if not self._n:
             try:
                 pr, fw, ones = scan_ebd_payload_stats(self.ebd_file)
                 msg = (
@@ -133,7 +189,7 @@ class Profile:
     # -------------------------------------------------------------------------
     def describe(self) -> str:
         """Short, one-line description for headers/logs."""
-        base = f"board={self.board}, ebd={self.ebd_file}, count={len(self._addrs)}"
+        base = f"board={self.board}, ebd={self.ebd_file}, count={self._n}"
         if self.mode == "random":
             base += f", mode=random, seed={self.seed}"
         else:
@@ -142,12 +198,38 @@ class Profile:
 
     def next_address(self) -> Optional[str]:
         """Return next LFA or None when the device-wide list is exhausted."""
-        if self._idx >= len(self._addrs):
+        if self._blob is None:
+            b = self._next_streamed()
+            return b.decode("ascii") if b is not None else None
+        if self._idx >= self._n:
             return None
-        a = self._addrs[self._idx]
+        a = lfa_at(self._blob, self._idx)
         self._idx += 1
         return a
 
+    def close(self) -> None:
+        """Release the cache file handle held in sequential mode (idempotent)."""
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            finally:
+                self._fh = None
+
+    def _next_streamed(self) -> Optional[bytes]:
+        # Sequential mode: next valid LFA line from the open cache file.
+        fh = self._fh
+        if fh is None:
+            return None
+        while True:
+            line = fh.readline()
+            if not line:
+                self.close()
+                return None
+            s = line.strip().upper()
+            if len(s) == 10 and not s.translate(None, _HEX_DIGITS):
+                self._idx += 1
+                return s
+
     # -------------------------------------------------------------------------
     # End-condition prompt (consumed by the controller)
     # -------------------------------------------------------------------------
@@ -20,7 +20,8 @@
 #     • paths    : comma-separated file paths
 #     • label    : single module label (resolved as <root>/<label>.txt)
 #     • labels   : comma-separated module labels
-#     • root     : directory used with label(s) to build file paths
+#     • root     : directory used with label(s) to build file paths (required
+#                  whenever label/labels is given)
 #
 #   Mixing strategy when multiple lists are provided:
 #     • strategy=concat       Concatenate lists in the given order (default)
@@ -45,8 +46,10 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
-import pathlib
+from itertools import chain
+from typing import Iterable, List, Optional, Sequence, Tuple
+import functools
+import os
 
 from fi.area.base import (
     load_addresses_file,
@@ -56,26 +59,47 @@ from fi.area.base import (
 )
 
 
+_TRUE = frozenset(("1", "true", "yes", "on"))
+
+
 def _parse_bool(val: str | bool | None, default: bool = False) -> bool:
     """Parse common boolean spellings from str|bool; None -> default."""
     if isinstance(val, bool):
         return val
     if val is None:
         return default
-    s = str(val).strip().lower()
-    return s in ("1", "true", "yes", "on")
+    return str(val).strip().lower() in _TRUE
 
 
 def _parse_int(val, default: Optional[int] = None) -> Optional[int]:
     """Best-effort integer parse; returns default on None or invalid."""
     if val is None:
         return default
+    if type(val) is int:
+        return val
     try:
         return int(str(val).strip())
-    except Exception:
+    except (TypeError, ValueError):
         return default
 
 
+@functools.lru_cache(maxsize=128)
+def _load_addresses_cached(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Parsed address file, memoized per (path, mtime, size); edits invalidate it."""
+    return tuple(load_addresses_file(path))
+
+
+def _load_addresses(path: str) -> Tuple[str, ...]:
+    """Addresses of 'path', reusing an earlier parse while the file is unchanged."""
+    st = os.stat(path)
+    return _load_addresses_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def _norm(val, default: str) -> str:
+    """Lowercased, stripped option value; default when empty or not a string."""
+    return (val or default).strip().lower() if isinstance(val, str) else default
+
+
 def _mode_to_merge(mode: Optional[str]) -> tuple[str, str]:
     """Map high-level 'mode' to (strategy, order)."""
     if not mode:
@@ -91,6 +115,8 @@ def _mode_to_merge(mode: Optional[str]) -> tuple[str, str]:
 class Profile:
     """MODULES area profile: merges per-module address lists and applies ordering."""
     name = "MODULES"
+    # Fixed attribute set: no per-instance __dict__ when many profiles are built.
+    __slots__ = ("_dedup", "_seed", "_order", "_addresses", "_files", "_strategy")
 
     def __init__(self,
                  *,
@@ -109,18 +135,24 @@ class Profile:
                  seed: str | int | None = None):
         """Collect inputs, load lists, merge deterministically, and finalize ordering."""
         # -------- Resolve merge/order from 'mode' first (may override below) ---
-        mode_strategy, mode_order = _mode_to_merge(mode)
-        eff_strategy = (mode_strategy if mode else (strategy or "concat")).strip().lower()
-        eff_order    = (mode_order    if mode else (order or "sequential")).strip().lower()
+        #      _mode_to_merge() already returns normalized names; only the
+        #      user-supplied strategy/order need normalizing.
+        if mode:
+            eff_strategy, eff_order = _mode_to_merge(mode)
+        else:
+            eff_strategy = _norm(strategy, "concat")
+            eff_order    = _norm(order, "sequential")
 
         # -------- Collect file paths from arguments ----------------------------
-        file_list: List[pathlib.Path] = []
+        #      Paths stay plain strings: they are only used as dedupe keys and
+        #      passed to open(), so no Path objects are built for them.
+        file_list: List[str] = []
 
         if path:
-            file_list.append(pathlib.Path(path))
+            file_list.append(str(path))
 
         if paths:
-            file_list.extend([pathlib.Path(p.strip()) for p in str(paths).split(",") if p.strip()])
+            file_list.extend([p.strip() for p in str(paths).split(",") if p.strip()])
 
         label_list: List[str] = []
         if label:
@@ -128,69 +160,76 @@ class Profile:
         if labels:
             label_list.extend([t.strip() for t in str(labels).split(",") if t.strip()])
 
-        root_dir = pathlib.Path(root) if root else None
-
-        if label_list and root_dir:
+        if label_list:
+            # Labels without a root used to be dropped silently; say so instead.
+            if not root:
+                raise ValueError("MODULES: 'label(s)' requires 'root'.")
             for lb in label_list:
-                file_list.append(root_dir / f"{lb}.txt")
+                file_list.append(os.path.join(root, lb + ".txt"))
 
         # Validate that we have at least one path source
         if not file_list:
             raise ValueError("MODULES: provide addresses via 'path/paths' or 'label(s)+root'.")
 
         # Dedup file_list while preserving order
-        seen = set()
-        unique_files: List[pathlib.Path] = []
-        for p in file_list:
-            sp = str(p)
-            if sp not in seen:
-                unique_files.append(p)
-                seen.add(sp)
-
-        # -------- Load lists ---------------------------------------------------
-        lists: List[List[str]] = [load_addresses_file(str(p)) for p in unique_files]
-
-        # -------- Merge strategy -----------------------------------------------
-        if eff_strategy == "roundrobin":
-            merged = round_robin_merge(lists)
-        else:
-            merged = []
-            for lst in lists:
-                merged.extend(lst)
+        unique_files: List[str] = list(dict.fromkeys(file_list))
 
-        # -------- Optional de-duplication --------------------------------------
+        # -------- Load + merge (+ optional de-duplication) ---------------------
+        #      Parsed files are shared (as tuples) across Profile instances in
+        #      this process, so re-building a profile for the same labels costs a
+        #      stat() per file. Concat extends the merged list from them
+        #      directly; dict.fromkeys() does the order-preserving dedupe in C.
         self._dedup = _parse_bool(dedupe, default=False)
-        if self._dedup:
-            merged = dedupe_preserve_order(merged)
+        merged: List[str] = []
+        if eff_strategy == "roundrobin":
+            merged = round_robin_merge([_load_addresses(p) for p in unique_files])
+            if self._dedup:
+                merged = dedupe_preserve_order(merged)
+        elif self._dedup:
+            merged = list(dict.fromkeys(chain.from_iterable(map(_load_addresses, unique_files))))
+        else:
+            for p in unique_files:
+                merged.extend(_load_addresses(p))
 
         # -------- Final ordering -----------------------------------------------
         self._seed: Optional[int] = _parse_int(seed, default=None)
         self._order = eff_order if eff_order in ("sequential", "shuffle") else "sequential"
-        self._addresses: List[str] = apply_ordering(merged, order=self._order, seed=self._seed)
+        #      'merged' is always a fresh list built above: sequential order
+        #      keeps it as-is, and a shuffle permutes it in place.
+        if self._order == "shuffle":
+            self._addresses: List[str] = apply_ordering(merged, order="shuffle", seed=self._seed, inplace=True)
+        else:
+            self._addresses = merged
 
         # -------- Metadata for describe() --------------------------------------
-        self._files = [str(p) for p in unique_files]
+        self._files = unique_files
         self._strategy = eff_strategy
 
     # -------------------------------------------------------------------------
     # Introspection (presentation-only)
     # -------------------------------------------------------------------------
     def describe(self) -> str:
-        parts = [
+        segs = (
             f"files={len(self._files)}",
             f"strategy={self._strategy}",
-        ]
-        if self._dedup:
-            parts.append("dedupe=true")
-        if self._order != "sequential":
-            parts.append(f"order={self._order}")
-        if self._seed is not None:
-            parts.append(f"seed={self._seed}")
-        return f"{', '.join(parts)} (total={len(self._addresses)})"
+            "dedupe=true" if self._dedup else "",
+            f"order={self._order}" if self._order != "sequential" else "",
+            f"seed={self._seed}" if self._seed is not None else "",
+        )
+        return f"{', '.join(filter(None, segs))} (total={len(self._addresses)})"
 
     # -------------------------------------------------------------------------
-    # Address iterator
+    # Address access (bulk list + iterator)
     # -------------------------------------------------------------------------
+    @property
+    def addresses(self) -> Sequence[str]:
+        """
+        The final address list itself, for bulk consumers (e.g.
+        out.write("\n".join(profile.addresses))). Treat it as read-only.
+        """
+        return self._addresses
+
     def iter_addresses(self) -> Iterable[str]:
-        for a in self._addresses:
-            yield a
\ No newline at end of file
+        # Plain list iterator: consumers step through it in C, with no
+        # generator frame resumed per address.
+        return iter(self._addresses)
\ No newline at end of file
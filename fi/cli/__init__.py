@@ -3,5 +3,6 @@
 # File: fi/cli/__init__.py
 # -----------------------------------------------------------------------------
 # Package marker for CLI entrypoints related to the fault injection workflow.
-# Holds user-facing commands such as: inject, assist, and status.
+# Holds user-facing commands such as: inject, assist, and status; shared
+# session setup (and multi-command main_many) lives in fi/cli/_common.py.
 # =============================================================================
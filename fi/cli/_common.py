@@ -0,0 +1,126 @@
+# =============================================================================
+# FATORI-V • Fault Injection Framework
+# File: fi/cli/_common.py
+# -----------------------------------------------------------------------------
+# Shared plumbing for the CLI entrypoints (inject, assist, status).
+#
+# Responsibilities
+#   • add_session_args(): the --dev/--baud/--run-name/--session options every
+#     entrypoint accepts.
+#   • open_session(): SerialConfig -> EventLogger -> SemTransport.open() ->
+#     log header -> SemProtocol.sync_prompt(), closing log and UART on exit.
+#   • main_many(): run several commands against ONE open session, so scripted
+#     sequences pay the UART open + prompt sync once instead of per command.
+#
+# Notes
+#   • Each entrypoint exposes build_parser() and run(args, log, proto), and
+#     builds its parser once at import (_PARSER); its main() is
+#     open_session() around run().
+# =============================================================================
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from contextlib import contextmanager
+from typing import Iterator, List, Sequence, Tuple
+
+from fi import settings
+from fi.semio.transport import SerialConfig, SemTransport
+from fi.semio.protocol import SemProtocol
+
+try:
+    from fi.log import EventLogger
+except Exception:  # pragma: no cover
+    from fi.log.events import EventLogger
+
+
+# Command name -> module implementing build_parser()/run()
+_COMMANDS = {
+    "inject": "fi.cli.inject",
+    "assist": "fi.cli.assist",
+    "status": "fi.cli.status",
+}
+
+
+def add_session_args(p: argparse.ArgumentParser) -> None:
+    """
+    Connection and log-location options shared by every entrypoint. They
+    default to None and are resolved against fi/settings.py by open_session(),
+    so a parser built once at import still honours later settings changes.
+    """
+    p.add_argument("--dev", default=None, help="Serial device path")
+    p.add_argument("--baud", type=int, default=None, help="Serial baud rate")
+    p.add_argument("--run-name", default=None, help="Run name for results/<run_name>/...")
+    p.add_argument("--session", default=None, help="Session/benchmark label")
+
+
+def _or(val, default):
+    return default if val is None else val
+
+
+@contextmanager
+def open_session(args) -> Iterator[Tuple[SerialConfig, EventLogger, SemTransport, SemProtocol]]:
+    """
+    Open the UART, write the log header and sync to the monitor prompt.
+    Yields (cfg, log, tr, proto); on exit the deferred log is flushed and the
+    UART closed, whether or not the body raised.
+    """
+    cfg = SerialConfig(device=_or(args.dev, settings.DEFAULT_SEM_DEVICE),
+                       baud=_or(args.baud, settings.BAUDRATE))
+    log = EventLogger(run_name=_or(args.run_name, settings.DEFAULT_RUN_NAME),
+                      session_label=_or(args.session, settings.DEFAULT_SESSION_LABEL),
+                      defer=settings.DEFER_LOG_WRITE)
+    tr = SemTransport(cfg)
+
+    try:
+        tr.open()
+        log.set_header(device=cfg.device, baud=cfg.baud, sem_freq_hz=settings.SEM_FREQ_HZ)
+
+        # Protocol facade manages prompt-synchronized exchanges with the monitor.
+        proto = SemProtocol(tr)
+        proto.sync_prompt()
+        yield cfg, log, tr, proto
+
+    finally:
+        # On exit, flush deferred log lines and close the UART cleanly.
+        log.close()
+        tr.close()
+
+
+def main_many(argv_list: Sequence[Sequence[str]]) -> None:
+    """
+    Run several CLI commands over one session. Each entry is an argv whose
+    first token names the command, e.g.:
+
+        main_many([["inject", "--addr", "0008000090D"], ["assist"], ["status"]])
+
+    All commands are parsed up front (a typo fails before the UART is opened).
+    The connection/log options of the first command apply to the session.
+    """
+    jobs: List[tuple] = []
+    for argv in argv_list:
+        if not argv or argv[0] not in _COMMANDS:
+            raise SystemExit(f"main_many: unknown command {argv[0] if argv else '<empty>'!r} "
+                             f"(expected one of: {', '.join(_COMMANDS)})")
+        mod = importlib.import_module(_COMMANDS[argv[0]])
+        jobs.append((mod, mod._PARSER.parse_args(list(argv[1:]))))
+    if not jobs:
+        return
+
+    with open_session(jobs[0][1]) as (_cfg, log, _tr, proto):
+        for mod, args in jobs:
+            mod.run(args, log, proto)
+
+
+if __name__ == "__main__":
+    # Commands separated by '--', e.g.:
+    #   python -m fi.cli._common inject --addr 0008000090D -- assist -- status
+    groups: List[List[str]] = [[]]
+    for tok in sys.argv[1:]:
+        if tok == "--":
+            groups.append([])
+        else:
+            groups[-1].append(tok)
+    sys.exit(main_many([g for g in groups if g]))
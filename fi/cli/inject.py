@@ -23,9 +23,7 @@ from __future__ import annotations
 import argparse
 import sys
 
-from fi import settings
-from fi.semio.transport import SerialConfig, SemTransport
-from fi.semio.protocol import SemProtocol
+from fi.cli._common import add_session_args, open_session
 
 # Logging import allows both new and legacy paths for flexibility.
 try:
@@ -39,50 +37,42 @@ from fi.core.injector import ensure_idle, inject_once, status
 def _log_rx_lines(log: EventLogger, lines):
     """
     Mirror each received text line into the session log as RX entries.
-    This preserves UART context alongside higher-level events.
+    This preserves UART context alongside higher-level events. The lines of
+    one read are recorded in a single call, under one timestamp.
     """
-    for l in lines:
-        log.log_rx(l)
+    log.log_rx_many(lines)
 
 
-def main(argv=None):
-    # ----------------------------- CLI parsing ------------------------------
+def build_parser() -> argparse.ArgumentParser:
     # Only the address token is required; other options default from settings.
     p = argparse.ArgumentParser(description="One-shot injection (no auto-observation).")
     p.add_argument("--addr", required=True, help="Address token: LFA hex or FAR,WORD,BIT")
-    p.add_argument("--dev", default=settings.DEFAULT_SEM_DEVICE, help="Serial device path")
-    p.add_argument("--baud", type=int, default=settings.BAUDRATE, help="Serial baud rate")
-    p.add_argument("--run-name", default=settings.DEFAULT_RUN_NAME, help="Run name for results/<run_name>/...")
-    p.add_argument("--session", default=settings.DEFAULT_SESSION_LABEL, help="Session/benchmark label")
-    args = p.parse_args(argv)
+    add_session_args(p)
+    return p
+
+
+# Built once at import; repeated main() calls (scripts, main_many) reuse it.
+_PARSER = build_parser()
+
+
+def run(args, log, proto) -> None:
+    """Enter Idle, run injection verbatim, then capture a quick counters snapshot."""
+    _log_rx_lines(log, ensure_idle(proto, log))
+    _log_rx_lines(log, inject_once(proto, log, args.addr))
+
+    s = status(proto, log)
+    log.log_rx_many([f"{k} {v}" for k, v in s.items()])
+
+
+def main(argv=None):
+    # ----------------------------- CLI parsing ------------------------------
+    args = _PARSER.parse_args(argv)
 
     # --------------------------- Transport + log ----------------------------
     # The logger writes a header with connection details and defers body writes
     # until close, so each session produces a single coherent file.
-    cfg = SerialConfig(device=args.dev, baud=args.baud)
-    log = EventLogger(run_name=args.run_name, session_label=args.session, defer=settings.DEFER_LOG_WRITE)
-    tr = SemTransport(cfg)
-
-    try:
-        tr.open()
-        log.set_header(device=cfg.device, baud=cfg.baud, sem_freq_hz=settings.SEM_FREQ_HZ)
-
-        # Protocol facade manages prompt-synchronized exchanges with the monitor.
-        proto = SemProtocol(tr)
-        proto.sync_prompt()
-
-        # Enter Idle, run injection verbatim, then capture a quick counters snapshot.
-        _log_rx_lines(log, ensure_idle(proto, log))
-        _log_rx_lines(log, inject_once(proto, log, args.addr))
-
-        s = status(proto, log)
-        for k, v in s.items():
-            log.log_rx(f"{k} {v}")
-
-    finally:
-        # On exit, flush deferred log lines and close the UART cleanly.
-        log.close()
-        tr.close()
+    with open_session(args) as (_cfg, log, _tr, proto):
+        run(args, log, proto)
 
 
 if __name__ == "__main__":
@@ -15,63 +15,56 @@ import argparse
 import sys
 import time
 
-from fi import settings
-from fi.semio.transport import SerialConfig, SemTransport
-from fi.semio.protocol import SemProtocol
-
-try:
-    from fi.log import EventLogger
-except Exception:  # pragma: no cover
-    from fi.log.events import EventLogger
-
+from fi.cli._common import add_session_args, open_session
 from fi.core.injector import status
 
 
-def main(argv=None):
-    # ----------------------------- CLI parsing ------------------------------
+def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Status helper (one-shot or --watch).")
     p.add_argument("--watch", action="store_true", help="Continuously poll and print counters")
     p.add_argument("--interval", type=float, default=1.0, help="Seconds between polls when --watch")
-    p.add_argument("--dev", default=settings.DEFAULT_SEM_DEVICE, help="Serial device path")
-    p.add_argument("--baud", type=int, default=settings.BAUDRATE, help="Serial baud rate")
-    p.add_argument("--run-name", default=settings.DEFAULT_RUN_NAME, help="Run name for results/<run_name>/...")
-    p.add_argument("--session", default=settings.DEFAULT_SESSION_LABEL, help="Session/benchmark label")
-    args = p.parse_args(argv)
+    add_session_args(p)
+    return p
+
+
+# Built once at import; repeated main() calls (scripts, main_many) reuse it.
+_PARSER = build_parser()
+
+
+def _poll_once(proto, log) -> None:
+    """One status snapshot: mirrored to the log and summarized on stdout."""
+    rx: list[str] = []
+    kv: list[str] = []
+    for k, v in status(proto, log).items():
+        rx.append(f"{k} {v}")
+        kv.append(f"{k}={v}")
+    # Mirror parsed counters to log line-by-line for readability.
+    log.log_rx_many(rx)
+    # Provide a compact stdout summary for interactive use.
+    print(" ".join(kv) if kv else "<no counters seen>")
+
+
+def run(args, log, proto) -> None:
+    """One snapshot, or periodic snapshots until Ctrl-C with --watch."""
+    if not args.watch:
+        _poll_once(proto, log)
+    else:
+        interval = args.interval
+        try:
+            while True:
+                _poll_once(proto, log)
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+
+def main(argv=None):
+    # ----------------------------- CLI parsing ------------------------------
+    args = _PARSER.parse_args(argv)
 
     # --------------------------- Transport + log ----------------------------
-    cfg = SerialConfig(device=args.dev, baud=args.baud)
-    log = EventLogger(run_name=args.run_name, session_label=args.session, defer=settings.DEFER_LOG_WRITE)
-    tr = SemTransport(cfg)
-
-    try:
-        tr.open()
-        log.set_header(device=cfg.device, baud=cfg.baud, sem_freq_hz=settings.SEM_FREQ_HZ)
-
-        proto = SemProtocol(tr)
-        proto.sync_prompt()
-
-        def one():
-            s = status(proto, log)
-            # Mirror parsed counters to log line-by-line for readability.
-            for k, v in s.items():
-                log.log_rx(f"{k} {v}")
-            # Provide a compact stdout summary for interactive use.
-            printable = " ".join(f"{k}={v}" for k, v in s.items())
-            print(printable if printable else "<no counters seen>")
-
-        if not args.watch:
-            one()
-        else:
-            try:
-                while True:
-                    one()
-                    time.sleep(args.interval)
-            except KeyboardInterrupt:
-                pass
-
-    finally:
-        log.close()
-        tr.close()
+    with open_session(args) as (_cfg, log, _tr, proto):
+        run(args, log, proto)
 
 
 if __name__ == "__main__":
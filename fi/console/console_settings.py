@@ -10,11 +10,11 @@
 #   styles and strings from this module to keep code paths free of literals.
 #
 # Structure
-#   • ANSI palette and helpers (colorize/mkstyle)
+#   • ANSI palette and helpers (colorize/mkstyle); color resolved once per COLOR_MODE
 #   • Layout and rule characters
 #   • Named style tokens used by the console
 #   • Prompt strings and mode switch styling
-#   • Tag prefixes and colors for console echo
+#   • Tag prefixes and colors for console echo (pre-resolved in STYLED)
 #   • Runtime behavior knobs used by the console loop
 #   • Help text blocks
 #   • UART formatting knobs mirrored for discoverability
@@ -24,6 +24,10 @@
 
 from __future__ import annotations
 
+import os
+import re
+import sys
+
 # ---------- ANSI color/style palette -----------------------------------------
 ANSI = {
     "reset": "\x1b[0m",
@@ -38,20 +42,55 @@ ANSI = {
     "br_cyan":   "\x1b[96m", "br_white":  "\x1b[97m",
 }
 
-def colorize(text: str, style: str | None) -> str:
-    """
-    Apply an ANSI style to text; returns text unchanged if style is falsy.
-    Styles should end with ANSI['reset'] to avoid color leakage.
-    """
-    if not style:
+# Color output:
+#   'auto'   -> ANSI only when stdout is a terminal and NO_COLOR is unset
+#   'always' -> ANSI even when piped/redirected
+#   'never'  -> plain text
+# Under fatori-v.py the FI process writes to a pipe; the orchestrator sets
+# FATORI_STDOUT_TTY=1 when its own stdout is a terminal, and 'auto' trusts it.
+COLOR_MODE = "auto"
+
+def _color_enabled(mode: str) -> bool:
+    mode = str(mode).lower()
+    if mode in ("always", "never"):
+        return mode == "always"
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FATORI_STDOUT_TTY") == "1":
+        return True
+    isatty = getattr(sys.stdout, "isatty", None)
+    try:
+        return bool(isatty and isatty())
+    except Exception:
+        return False
+
+# Resolved once at import. When off, every style below comes out "" and
+# colorize() is a pass-through, so all pre-styled strings are plain text.
+COLOR_ENABLED = _color_enabled(COLOR_MODE)
+
+_RESET = ANSI["reset"] if COLOR_ENABLED else ""
+
+if COLOR_ENABLED:
+    def colorize(text: str, style: str | None) -> str:
+        """
+        Apply an ANSI style to text; returns text unchanged if style is falsy.
+        Styles should end with ANSI['reset'] to avoid color leakage.
+        """
+        if not style:
+            return text
+        return f"{style}{text}{_RESET}"
+else:
+    def colorize(text: str, style: str | None) -> str:
+        """Color output disabled (see COLOR_MODE): return text unchanged."""
         return text
-    return f"{style}{text}{ANSI['reset']}"
 
 def mkstyle(*names: str) -> str:
     """
     Compose a style by concatenating palette entries by name.
-    Example: mkstyle('bold', 'br_blue')
+    Example: mkstyle('bold', 'br_blue'). Empty when color output is off.
     """
+    if not COLOR_ENABLED:
+        return ""
     return "".join(ANSI[n] for n in names if n in ANSI)
 
 # ---------- layout and rules --------------------------------------------------
@@ -96,6 +135,19 @@ TAG_SEND = mkstyle("br_yellow")
 TAG_RECV = mkstyle("br_green")
 TAG_ERROR = mkstyle("br_red")
 
+# Tag styles resolved once into (head, tail) pairs: head = style + prefix,
+# tail = reset ("" when unstyled). Echo helpers print f"{head}{text}{tail}",
+# which equals colorize(prefix + text, style) with no per-line work.
+def _styled(prefix: str, style: str) -> tuple[str, str]:
+    return (f"{style}{prefix}", _RESET) if style else (prefix, "")
+
+STYLED = {
+    "INFO":  _styled(PREFIX_INFO, TAG_INFO),
+    "SEND":  _styled(PREFIX_TX, TAG_SEND),
+    "RECV":  _styled(PREFIX_RX, TAG_RECV),
+    "ERROR": _styled(PREFIX_ERROR, TAG_ERROR),
+}
+
 # ---------- runtime behaviour knobs ------------------------------------------
 # Initial state to push the SEM core into when the console starts.
 #   'observe' -> send O (enter Observation)
@@ -168,6 +220,10 @@ READ_TIMEOUT_S  = 0.05
 WRITE_TIMEOUT_S = 0.10
 OPEN_TIMEOUT_S  = 2.0
 PROMPT_REGEX    = r"^[IOD]>\s*$"
+# Compiled once here so the RX path never recompiles it. For this fixed
+# pattern an equivalent regex-free test is:
+#   len(s) >= 2 and s[0] in "IOD" and s[1] == ">" and not s[2:].strip()
+PROMPT_RE       = re.compile(PROMPT_REGEX)
 
 # ---------- log formatting knobs ---------------------------------------------
 # Number of spaces inserted between the transmitted command string and
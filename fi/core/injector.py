@@ -5,7 +5,8 @@
 # High-level helpers that drive the SEM protocol for common tasks:
 #   • Directed state changes: enter Idle / Observation.
 #   • One-shot status query (parsed counters dict).
-#   • Assist loop that waits for correction within a timeout.
+#   • Assist wait that follows the streamed SC/FC lines until correction or
+#     timeout (one 'S' seeds the state; no status polling).
 #   • Blocking injection helper retained for console/manual use.
 #
 # Notes
@@ -22,29 +23,22 @@ import re
 
 from fi.semio.protocol import SemProtocol
 
-_RE_PROMPT  = re.compile(r'^[IOD]>\s*$')
+# Bare monitor prompts (trailing whitespace stripped); a set lookup, no regex.
+_PROMPT_SET = frozenset(('I>', 'O>', 'D>'))
 _RE_SC_LINE = re.compile(r'^SC\s+([0-9A-Fa-f]{2})$')
 _RE_ECHO_N  = re.compile(r'^[IOD]>\s+N\s', re.IGNORECASE)
-
-
-def _transport_from_proto(proto: SemProtocol):
-    for name in ("tr", "transport", "_tr", "_transport"):
-        tr = getattr(proto, name, None)
-        if tr is not None:
-            return tr
-    raise AttributeError("SemProtocol instance does not expose its transport (tr/transport).")
+# Counter line ("AA VV"), same shape SemProtocol.status() keeps.
+_RE_COUNTER = re.compile(r'^([A-Z]{2})\s+([0-9A-FXx]+)$')
 
 
 # -------- state transitions ---------------------------------------------------
 def ensure_idle(proto: SemProtocol, log) -> List[str]:
     proto.goto_idle()
-    tr = _transport_from_proto(proto)
-    return tr.read_until_prompt(timeout_s=2.0)
+    return proto.tr.read_until_prompt(timeout_s=2.0)
 
 def go_observe(proto: SemProtocol, log) -> List[str]:
     proto.goto_observe()
-    tr = _transport_from_proto(proto)
-    return tr.read_until_prompt(timeout_s=2.0)
+    return proto.tr.read_until_prompt(timeout_s=2.0)
 
 
 # -------- status --------------------------------------------------------------
@@ -54,16 +48,32 @@ def status(proto: SemProtocol, log) -> Dict[str, str]:
 
 
 # -------- assist loop ---------------------------------------------------------
+def assist_cleared(counters: Dict[str, str]) -> bool:
+    """True once SEM is back in Idle (SC 00) with no pending FC count."""
+    return counters.get("SC") == "00" and counters.get("FC") in (None, "00", "0")
+
+
 def assist_until_fc(proto: SemProtocol, log, timeout_ms: int) -> bool:
-    deadline = time.time() + timeout_ms / 1000.0
-    while time.time() < deadline:
-        s = status(proto, log)
-        sc = s.get("SC")
-        fc = s.get("FC")
-        if sc == "00" and (fc in (None, "00", "0")):
+    """
+    Wait up to timeout_ms for SEM to clear the injected error.
+    One 'S' is sent to seed the SC/FC state; after that the caller sleeps on
+    the transport's reader (wait_for_lines) and re-evaluates assist_cleared()
+    on every counter line SEM streams, instead of re-sending 'S'.
+    """
+    tr = proto.tr
+    deadline = time.monotonic() + timeout_ms / 1000.0
+    counters: Dict[str, str] = {}
+    proto.passthrough("S")
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not tr.wait_for_lines(timeout_s=remaining):
+            return False
+        for ln in tr.read_lines(timeout_s=0.0):
+            m = _RE_COUNTER.match(ln.strip())
+            if m:
+                counters[m.group(1)] = m.group(2)
+        if assist_cleared(counters):
             return True
-        time.sleep(0.1)
-    return False
 
 
 # -------- blocking injection (console/manual) --------------------------------
@@ -72,19 +82,32 @@ def _parse_inject_ack(lines: Iterable[str]) -> Tuple[bool, bool, bool]:
     sc10 = False
     sc00 = False
     for ln in lines:
-        if _RE_ECHO_N.match(ln):
-            echo = True
-        m = _RE_SC_LINE.match(ln)
-        if not m:
+        # Cheap prefix tests first; the regexes only run on candidate lines.
+        if ln[1:2] == ">":
+            if ln.rstrip() not in _PROMPT_SET and _RE_ECHO_N.match(ln):
+                echo = True
+                if sc10 and sc00:
+                    return True, True, True
             continue
-        try:
-            val = int(m.group(1), 16)
-        except ValueError:
+        if ln[:2] != "SC":
             continue
-        if val == 0x10:
+        if len(ln) == 5 and ln[2] == " ":
+            code = ln[3:]          # canonical "SC xx"
+        else:
+            m = _RE_SC_LINE.match(ln)
+            if not m:
+                continue
+            code = m.group(1)
+        # Only 10 and 00 matter and neither has hex letters: compare text.
+        if code == "10":
             sc10 = True
-        elif val == 0x00:
+        elif code == "00":
             sc00 = True
+        else:
+            continue
+        # All three seen: the rest of the burst cannot change the result.
+        if echo and sc10 and sc00:
+            return True, True, True
     return echo, sc10, sc00
 
 
@@ -94,7 +117,7 @@ def inject_once(proto: SemProtocol, log, addr: str, timeout_s: float = 2.0) -> L
     Intended for console/manual use; time profiles do not use this path.
     """
     proto.inject_lfa(addr)
-    tr = _transport_from_proto(proto)
+    tr = proto.tr
     first = tr.read_until_prompt(timeout_s=timeout_s)
     echo, sc10, sc00 = _parse_inject_ack(first)
     if echo and sc10 and sc00:
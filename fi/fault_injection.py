@@ -49,8 +49,9 @@ import importlib
 import secrets
 import re
 import collections
+import functools
 import os
-import select
+import selectors
 from typing import Optional, Dict, Deque, Callable, Tuple, List
 
 from fi import settings
@@ -62,48 +63,92 @@ from fi.console import console_settings as cs
 
 
 # ---------- console echo helpers --------------------------------------------
+# Styled (head, tail) pairs resolved once from console settings.
+_INFO_HEAD, _INFO_TAIL = cs.STYLED["INFO"]
+_ERROR_HEAD, _ERROR_TAIL = cs.STYLED["ERROR"]
+_TX_HEAD, _TX_TAIL = cs.STYLED["SEND"]
+_RX_HEAD, _RX_TAIL = cs.STYLED["RECV"]
+
 def _info(msg: str) -> None:
     """
     Print an INFO-class line using console styles.
     The prefix is provided by console_settings to keep the visual identity
     consistent with the rest of the console output.
     """
-    print(cs.colorize(f"{cs.PREFIX_INFO}{msg}", cs.TAG_INFO))
+    print(f"{_INFO_HEAD}{msg}{_INFO_TAIL}")
 
 def _error(msg: str) -> None:
     """
     Print an ERROR-class line using console styles.
     """
-    style = getattr(cs, "TAG_ERROR", cs.SECTION_HEADER_STYLE)
-    prefix = getattr(cs, "PREFIX_ERROR", "[ERROR] ")
-    print(cs.colorize(f"{prefix}{msg}", style))
+    print(f"{_ERROR_HEAD}{msg}{_ERROR_TAIL}")
 
 def _tx_echo(cmd: str) -> None:
     """
     Echo a TX line (command sent to SEM) on the console with the TX tag style.
     """
-    print(cs.colorize(f"{cs.PREFIX_TX}{cmd}", cs.TAG_SEND))
+    print(f"{_TX_HEAD}{cmd}{_TX_TAIL}")
 
 def _rx_echo(line: str) -> None:
     """
     Echo an RX line (SEM reply) on the console with the RX tag style.
     """
-    print(cs.colorize(f"{cs.PREFIX_RX}{line}", cs.TAG_RECV))
+    print(f"{_RX_HEAD}{line}{_RX_TAIL}")
+
+def _rx_echo_many(lines) -> None:
+    """
+    Echo several RX lines with one stdout write (e.g. a status snapshot).
+    """
+    sys.stdout.write("".join([f"{_RX_HEAD}{ln}{_RX_TAIL}\n" for ln in lines]))
+    sys.stdout.flush()
 
 def _rule(ch: str, n: int) -> str:
     return ch * n
 
+# Default-styled rules, the mode-switch rule and the help blocks are
+# colorized once at import.
+_RULE_BIG   = cs.colorize(_rule(cs.BIG_LINE_CHAR, cs.LINE_WIDTH), cs.BIG_LINE_STYLE)
+_RULE_SMALL = cs.colorize(_rule(cs.SMALL_LINE_CHAR, cs.LINE_WIDTH), cs.SMALL_LINE_STYLE)
+_RULE_SWITCH = cs.colorize(_rule(cs.BIG_LINE_CHAR, cs.LINE_WIDTH), cs.SWITCH_RULE_STYLE)
+_CONSOLE_HELP_BLOCK = "\n".join((
+    cs.colorize("Console commands", cs.SECTION_HEADER_STYLE),
+    cs.colorize(cs.CONSOLE_HELP.rstrip(), cs.HELP_BODY_STYLE),
+))
+_SEM_HELP_BLOCK = "\n".join((
+    cs.colorize("SEM IP commands", cs.SECTION_HEADER_STYLE),
+    cs.colorize(cs.SEM_CHEATSHEET.rstrip(), cs.HELP_BODY_STYLE),
+))
+_HELP_ALL_BLOB = "\n".join((_RULE_SMALL, _CONSOLE_HELP_BLOCK, _RULE_SMALL, _SEM_HELP_BLOCK, _RULE_SMALL))
+_HELP_SEM_BLOB = "\n".join((_RULE_SMALL, _SEM_HELP_BLOCK, _RULE_SMALL))
+
 def _print_rule_big(style: str | None = None) -> None:
     """
     Print a full-width rule for major section transitions.
     """
-    print(cs.colorize(_rule(cs.BIG_LINE_CHAR, cs.LINE_WIDTH), style or cs.BIG_LINE_STYLE))
+    if not style:
+        print(_RULE_BIG)
+    elif style == cs.SWITCH_RULE_STYLE:
+        print(_RULE_SWITCH)
+    else:
+        print(cs.colorize(_rule(cs.BIG_LINE_CHAR, cs.LINE_WIDTH), style))
 
 def _print_rule_small(style: str | None = None) -> None:
     """
     Print a thin rule for minor separations.
     """
-    print(cs.colorize(_rule(cs.SMALL_LINE_CHAR, cs.LINE_WIDTH), style or cs.SMALL_LINE_STYLE))
+    print(cs.colorize(_rule(cs.SMALL_LINE_CHAR, cs.LINE_WIDTH), style) if style else _RULE_SMALL)
+
+def _print_help_all() -> None:
+    """
+    Print console commands and the SEM cheatsheet between thin rules.
+    """
+    print(_HELP_ALL_BLOB)
+
+def _print_help_sem_only() -> None:
+    """
+    Print only the SEM cheatsheet between thin rules.
+    """
+    print(_HELP_SEM_BLOB)
 
 def _center(text: str, width: int) -> str:
     """
@@ -117,35 +162,32 @@ def _center(text: str, width: int) -> str:
 # ---------- RX activity tracker for manual prompt gating ---------------------
 class _RxState:
     """
-    Tracks time since last RX line. Manual prompt waits for a quiet gap so
-    it does not interleave with bursts of SEM replies.
+    Tracks time since last RX batch. Manual prompt waits for a quiet gap so
+    it does not interleave with bursts of SEM replies. The RX printer bumps
+    once per drained batch and is the only writer; rebinding a float is
+    atomic in CPython, so readers need no lock.
     """
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._last = time.monotonic()
+        self.last_rx = time.monotonic()
     def bump(self) -> None:
-        with self._lock:
-            self._last = time.monotonic()
+        self.last_rx = time.monotonic()
     def millis_since_rx(self) -> float:
-        with self._lock:
-            return (time.monotonic() - self._last) * 1000.0
+        return (time.monotonic() - self.last_rx) * 1000.0
 
 
 # ---------- TX activity tracker for manual prompt gating ---------------------
 class _TxState:
     """
     Tracks time since last *manual* TX. This is optionally included in the
-    quiet-window condition when printing the manual prompt.
+    quiet-window condition when printing the manual prompt. Only the console
+    thread writes it, so it is lock-free like _RxState.
     """
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._last = time.monotonic()
+        self.last_tx = time.monotonic()
     def bump(self) -> None:
-        with self._lock:
-            self._last = time.monotonic()
+        self.last_tx = time.monotonic()
     def millis_since_tx(self) -> float:
-        with self._lock:
-            return (time.monotonic() - self._last) * 1000.0
+        return (time.monotonic() - self.last_tx) * 1000.0
 
 
 def _wait_quiet_then_prompt(rx_state: _RxState, quiet_ms: int, max_wait_ms: int,
@@ -161,24 +203,93 @@ def _wait_quiet_then_prompt(rx_state: _RxState, quiet_ms: int, max_wait_ms: int,
     except Exception:
         tx_quiet_ms = quiet_ms
 
-    t0 = time.monotonic()
+    quiet_s = quiet_ms / 1000.0
+    tx_quiet_s = tx_quiet_ms / 1000.0
+
+    # Sleep exactly until the quiet window(s) would end, capped by max_wait;
+    # activity in the meantime only moves that point later, so re-check.
+    deadline = time.monotonic() + max_wait_ms / 1000.0
     while True:
-        rx_ok = (rx_state.millis_since_rx() >= quiet_ms)
-        tx_ok = True if tx_state is None else (tx_state.millis_since_tx() >= tx_quiet_ms)
-        if rx_ok and tx_ok: break
-        if (time.monotonic() - t0) * 1000.0 > max_wait_ms: break
-        time.sleep(0.02)
+        now = time.monotonic()
+        wake = rx_state.last_rx + quiet_s
+        if tx_state is not None:
+            wake = max(wake, tx_state.last_tx + tx_quiet_s)
+        wake = min(wake, deadline)
+        if now >= wake:
+            break
+        time.sleep(wake - now)
     print(cs.PROMPT_MANUAL, end="", flush=True)
 
 
+# ---------- selectable auto-exit event ---------------------------------------
+class _PipeEvent(threading.Event):
+    """
+    threading.Event that can also wake a selector: set() writes one byte to
+    a self-pipe whose read end is exposed via fileno(). Lets stdin reads
+    block in a single select() and still return the moment auto-exit fires.
+    Both ends are non-blocking; clear() drains the pipe so a cleared event
+    no longer reads as ready, and set() after close() is a plain Event.set().
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self._rfd, self._wfd = os.pipe()
+        os.set_blocking(self._rfd, False)
+        os.set_blocking(self._wfd, False)
+    def set(self) -> None:
+        super().set()
+        if self._wfd < 0:
+            return
+        try:
+            os.write(self._wfd, b"\0")
+        except OSError:
+            pass  # pipe full (already readable) or closed concurrently
+    def clear(self) -> None:
+        super().clear()
+        if self._rfd < 0:
+            return
+        try:
+            while os.read(self._rfd, 4096):
+                pass
+        except OSError:
+            pass  # BlockingIOError: drained
+    def fileno(self) -> int:
+        return self._rfd
+    def close(self) -> None:
+        fds, self._rfd, self._wfd = (self._rfd, self._wfd), -1, -1
+        for fd in fds:
+            if fd < 0:
+                continue
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+# ---------- RX line classification -------------------------------------------
+_RE_SC_LINE = re.compile(r'^SC\s+([0-9A-Fa-f]{2})$')
+_RE_I_N = re.compile(r'^\s*I>\s+N\b')  # recognizes "I> N ..." injection echo
+
+def _is_sc00(line: str) -> bool:
+    """
+    True for a monitor 'SC 00' status line. The canonical 5-char form is a
+    plain slice compare; only odd spacing falls back to the regex.
+    """
+    if line[:2] != "SC":
+        return False
+    if len(line) == 5 and line[2] == " ":
+        return line[3:] == "00"
+    m = _RE_SC_LINE.match(line)
+    return m is not None and m.group(1) == "00"
+
+
 # ---------- ACK tracker (fed by RX printer; waited by profiles) -------------
 class _AckTracker:
     """
     Detect completion for an injection based on status code:
       SC 00 -> completed
-    The RX printer feeds on_rx(); a time profile may call start() then wait().
+    The RX printer classifies each line once and reports SC 00 via on_sc00();
+    a time profile may call start() then wait().
     """
-    _RE_SC = re.compile(r'^SC\s+([0-9A-Fa-f]{2})$')
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
@@ -190,26 +301,22 @@ class _AckTracker:
             self._pending = True
             self._event.clear()
 
-    def on_rx(self, line: str) -> bool:
+    def on_sc00(self) -> bool:
         """
-        Feed a received line to the tracker.
-        Returns True only when a pending injection is confirmed completed by SC 00.
+        Report an 'SC 00' line seen by the RX printer.
+        Returns True only when it completes a pending injection.
         """
+        # Unlocked pre-check: reading a bool is atomic, and SC 00 often
+        # arrives with nothing pending (e.g. status). The flag is re-checked
+        # under the lock before the completion transition.
+        if not self._pending:
+            return False
         with self._lock:
             if not self._pending:
                 return False
-            m = self._RE_SC.match(line)
-            if not m:
-                return False
-            try:
-                val = int(m.group(1), 16)
-            except ValueError:
-                return False
-            if val == 0x00:
-                self._pending = False
-                self._event.set()
-                return True
-            return False
+            self._pending = False
+            self._event.set()
+            return True
 
     def wait(self, timeout_s: float) -> bool:
         """
@@ -229,52 +336,79 @@ class _TxEchoGate:
     """
     def __init__(self, print_func: Callable[[str], None]) -> None:
         self._print = print_func
-        self._lock = threading.Lock()
         self._queue: Deque[str] = collections.deque()
-        self._printed = 0
-        self._completed = 0
+        self._printed = 0     # written only inside _drain()
+        self._completed = 0   # written only by the RX printer (on_sc00)
+        # Held only while draining; other callers try-lock and skip instead
+        # of waiting, since the holder (or their own re-check) prints for them.
+        self._drain_lock = threading.Lock()
 
     def send_echo(self, text: str) -> None:
-        with self._lock:
-            if self._printed <= self._completed:
-                self._print(text); self._printed += 1
-            else:
-                self._queue.append(text)
+        self._queue.append(text)
+        self._drain()
 
     def on_sc00(self) -> None:
-        with self._lock:
-            self._completed += 1
-            if self._queue and self._printed <= self._completed:
-                self._print(self._queue.popleft()); self._printed += 1
+        self._completed += 1
+        self._drain()
+
+    def _drain(self) -> None:
+        """
+        Print queued echoes while the printed count has not passed the
+        completed count. After releasing, re-check once more so an update
+        made while another caller held the lock is never left unprinted.
+        """
+        while self._queue and self._printed <= self._completed:
+            if not self._drain_lock.acquire(blocking=False):
+                return
+            try:
+                while self._queue and self._printed <= self._completed:
+                    self._print(self._queue.popleft())
+                    self._printed += 1
+            finally:
+                self._drain_lock.release()
 
 
 # ---------- parse helpers ----------------------------------------------------
+# One CSV item: key, optional '=' and value (split at the first '='),
+# surrounding whitespace excluded; empty items match with no key and no '='.
+_KW_RE = re.compile(r'\s*([^,=]*?)\s*(?:(=)\s*([^,]*?))?\s*(?:,|$)')
+
 def _parse_kwargs(csv: Optional[str]) -> Dict[str, str]:
     """
     Parse a CSV-form key=value list into a dict. Bare flags are interpreted
     as 'true' strings for convenience in CLI usage.
     """
     if not csv: return {}
-    out: Dict[str, str] = {}
-    for part in csv.split(","):
-        part = part.strip()
-        if not part: continue
-        if "=" in part:
-            k, v = part.split("=", 1)
-            out[k.strip()] = v.strip()
-        else:
-            out[part] = "true"
-    return out
+    return {k: (v if eq else "true") for k, eq, v in _KW_RE.findall(csv) if k or eq}
 
 
 # ---------- dynamic loaders --------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def _resolve_profile(package: str, name: str):
+    """
+    Return the Profile class of fi.<package>.<name>. Memoized, so repeated
+    loads (re-arming on resume) skip the import machinery and attribute lookup.
+    """
+    return getattr(importlib.import_module(f"fi.{package}.{name}"), "Profile")
+
 def _load_area(name: str, kwargs: Dict[str, str]):
     """
     Dynamically import fi.area.<name> and instantiate its Profile with kwargs.
     """
-    mod = importlib.import_module(f"fi.area.{name}")
-    cls = getattr(mod, "Profile")
-    return cls(**kwargs)
+    return _resolve_profile("area", name)(**kwargs)
+
+def _close_area(area) -> None:
+    """
+    Release resources an area profile may hold (e.g. the device profile's
+    open cache file in sequential mode). Safe on None and on profiles
+    without close().
+    """
+    close = getattr(area, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:
+            pass
 
 def _load_time(name: str, *, proto, log, area, pause_evt, stop_evt, tx_echo, ack_tracker, kwargs: Dict[str, str]):
     """
@@ -282,8 +416,7 @@ def _load_time(name: str, *, proto, log, area, pause_evt, stop_evt, tx_echo, ack
     shared wiring (protocol, logger, area, control events, tx echo function,
     ack tracker) plus profile-specific kwargs.
     """
-    mod = importlib.import_module(f"fi.time.{name}")
-    cls = getattr(mod, "Profile")
+    cls = _resolve_profile("time", name)
     return cls(proto=proto, log=log, area=area,
                pause_evt=pause_evt, stop_evt=stop_evt,
                tx_echo=tx_echo, ack_tracker=ack_tracker, **kwargs)
@@ -317,13 +450,11 @@ def _print_console_header_and_help(*, start_mode_label: str,
     _print_rule_big()
 
     if show_console_cmds:
-        print(cs.colorize("Console commands", cs.SECTION_HEADER_STYLE))
-        print(cs.colorize(cs.CONSOLE_HELP.rstrip(), cs.HELP_BODY_STYLE))
+        print(_CONSOLE_HELP_BLOCK)
         _print_rule_small()
 
     if show_sem_cheatsheet:
-        print(cs.colorize("SEM IP commands", cs.SECTION_HEADER_STYLE))
-        print(cs.colorize(cs.SEM_CHEATSHEET.rstrip(), cs.HELP_BODY_STYLE))
+        print(_SEM_HELP_BLOCK)
         _print_rule_big()
 
     if show_start_mode:
@@ -360,9 +491,9 @@ def _do_status(proto: SemProtocol, log: EventLogger) -> bool:
     if not s:
         print("<no counters seen>")
         return False
-    for k, v in s.items():
-        pair = f"{k} {v}"
-        log.log_rx(pair); _rx_echo(pair)
+    pairs = [f"{k} {v}" for k, v in s.items()]
+    log.log_rx_many(pairs)
+    _rx_echo_many(pairs)
     return True
 
 
@@ -436,25 +567,65 @@ def _reconcile_and_cap_time_kwargs(time_kwargs: Dict[str, str]) -> Tuple[Dict[st
 
 
 # ---------- preflight connectivity -------------------------------------------
+# Status counter line ("AA VV"), same shape SemProtocol.status() keeps.
+_RE_STATUS_PAIR = re.compile(r"^([A-Z]{2})\s+([0-9A-FXx]+)$")
+
+# Reply window SemProtocol.status() collects for; an attempt waits this long
+# plus the retry interval, so the worst-case cadence matches a blocking query.
+_STATUS_REPLY_WINDOW_S = 0.3
+
+# Distinct counter keys a reply must carry to count as a status report. A
+# burst of 'SC xx' lines (e.g. a late injection completion) has only one key.
+_STATUS_MIN_KEYS = 2
+
+class _RxHook:
+    """
+    One optional per-line callback consulted by the campaign RX printer, for
+    foreground checks that want to observe replies without gating it off.
+    """
+    def __init__(self) -> None:
+        self.fn: Optional[Callable[[str], None]] = None
+
+
 def _preflight_sem(proto: SemProtocol, log: EventLogger,
-                   rx_enabled: threading.Event,
+                   rx_hook: _RxHook,
                    attempts: int, interval_s: float) -> bool:
     """
     Verify device responsiveness before arming any profiles.
-    Sends 'S' repeatedly; succeeds on the first attempt that returns counters.
-    The RX printer is temporarily gated off to avoid double-reading.
+    Sends 'S' repeatedly; succeeds as soon as the running RX printer has seen
+    a status report for the current attempt: counter lines received after
+    the 'S' was written, with at least _STATUS_MIN_KEYS distinct keys (the
+    printer logs and echoes the reply as usual). Lines already in flight
+    before the write, or a lone run of 'SC xx' lines, do not pass.
     """
-    ok = False
-    for _ in range(max(1, attempts)):
-        rx_enabled.clear()
-        try:
-            ok = _do_status(proto, log)
-        finally:
-            rx_enabled.set()
-        if ok:
-            break
-        time.sleep(max(0.05, interval_s))
-    return ok
+    # (keys seen, done) for the attempt in progress; None between attempts.
+    reply: Optional[Tuple[set, threading.Event]] = None
+
+    def _on_line(ln: str) -> None:
+        cur = reply
+        if cur is None:
+            return
+        m = _RE_STATUS_PAIR.match(ln.strip())
+        if m is None:
+            return
+        keys, done = cur
+        keys.add(m.group(1))
+        if len(keys) >= _STATUS_MIN_KEYS:
+            done.set()
+
+    rx_hook.fn = _on_line
+    try:
+        for _ in range(max(1, attempts)):
+            reply = None
+            log.log_tx("S"); _tx_echo("S")
+            proto.passthrough("S")
+            cur = (set(), threading.Event())
+            reply = cur
+            if cur[1].wait(_STATUS_REPLY_WINDOW_S + max(0.05, interval_s)):
+                return True
+        return False
+    finally:
+        rx_hook.fn = None
 
 
 # ---------- CLI parsing helpers ----------------------------------------------
@@ -624,9 +795,12 @@ def main(argv=None):
     rx_enabled = threading.Event(); rx_enabled.set()
     rx_state = _RxState()
     tx_state = _TxState()
+    rx_hook = _RxHook()   # temporary per-line observer (preflight)
 
-    # Auto-exit event (signaled by arming failure or profile end when requested)
-    auto_exit_evt = threading.Event()
+    # Auto-exit event (signaled by arming failure or profile end when requested);
+    # selectable so the --on-end=exit stdin wait wakes on it immediately.
+    auto_exit_evt = _PipeEvent()
+    stdin_sel: Optional[selectors.BaseSelector] = None
 
     # Injection TX echo gate — presentation-only; can be disabled in settings.
     inj_tx_gate = _TxEchoGate(print_func=lambda text: print(text)) if bool(getattr(cs, "INJECTION_ECHO_GATE_ENABLED", True)) else None
@@ -637,9 +811,9 @@ def main(argv=None):
         [SEND] echoes are sequenced after SC 00 for the previous shot.
         """
         if inj_tx_gate is not None:
-            inj_tx_gate.send_echo(cs.colorize(f"{cs.PREFIX_TX}{cmd}", cs.TAG_SEND))
+            inj_tx_gate.send_echo(f"{_TX_HEAD}{cmd}{_TX_TAIL}")
         else:
-            print(cs.colorize(f"{cs.PREFIX_TX}{cmd}", cs.TAG_SEND))
+            print(f"{_TX_HEAD}{cmd}{_TX_TAIL}")
 
     def _rx_printer(tr_local: SemTransport, log_local: EventLogger,
                     enabled_evt: threading.Event, stop_flag: threading.Event,
@@ -653,8 +827,9 @@ def main(argv=None):
         status commands) do not trigger [SEND] releases.
         """
         poll_timeout = max(0.02, getattr(cs, "RX_PRINTER_POLL_S", 0.03))
-        _RE_SC = re.compile(r'^SC\s+([0-9A-Fa-f]{2})$')
-        _RE_I_N = re.compile(r'^\s*I>\s+N\b')  # recognizes "I> N ..." injection echo
+        # Patterns are compiled at module scope; bind the hot callables once.
+        inj_echo_match = _RE_I_N.match
+        ack_on_sc00 = ack_tracker.on_sc00
         in_inject_context = False              # True after "I> N ..." until the matching SC 00
 
         while not stop_flag.is_set():
@@ -664,33 +839,37 @@ def main(argv=None):
             lines = tr_local.read_lines(timeout_s=poll_timeout)
             if not lines:
                 continue
+            # The whole drained batch goes to the deferred log in one call.
+            # Echoes are collected and written in one go, flushed early only
+            # before a [SEND] release so console order is unchanged.
+            log_local.log_rx_many(lines)
+            rxst.bump()
+            hook = rx_hook.fn
+            if hook is not None:
+                for ln in lines:
+                    hook(ln)
+            echo: List[str] = []
             for ln in lines:
                 # Context tracking for injection completion association
-                if _RE_I_N.match(ln):
+                if "I>" in ln and inj_echo_match(ln):
                     in_inject_context = True
 
-                # Ack tracker returns True only when a pending inject completes
-                sc00_from_pending = ack_tracker.on_rx(ln)
-
-                # Detect SC 00 from the monitor
-                is_sc00 = False
-                m = _RE_SC.match(ln)
-                if m:
-                    try:
-                        is_sc00 = (int(m.group(1), 16) == 0x00)
-                    except ValueError:
-                        is_sc00 = False
+                # Classify once; the ack tracker only hears about SC 00 and
+                # returns True only when a pending inject completes.
+                is_sc00 = _is_sc00(ln)
+                sc00_from_pending = is_sc00 and ack_on_sc00()
 
-                # Log and echo the RX line
-                log_local.log_rx(ln)
-                _rx_echo(ln)
-                rxst.bump()
+                echo.append(ln)
 
                 # Release one queued [SEND] only if we are in an injection context
                 # and this SC 00 corresponds to the end of that injection.
                 if inj_tx_gate is not None and is_sc00 and (in_inject_context or sc00_from_pending):
+                    _rx_echo_many(echo)
+                    echo.clear()
                     inj_tx_gate.on_sc00()
                     in_inject_context = False
+            if echo:
+                _rx_echo_many(echo)
 
     threading.Thread(
         target=_rx_printer,
@@ -711,18 +890,31 @@ def main(argv=None):
                 return input("")
             except EOFError:
                 return None
-        # Polling input (POSIX select); checks auto-exit every 100 ms
+        # Event-driven input (POSIX): one selector, registered once, waits on
+        # stdin and the auto-exit self-pipe together with no timeout.
+        # epoll refuses regular files (stdin redirected from a file), so that
+        # case falls back to select(), which reports such files as readable.
         if prompt_empty:
             pass  # intentional: driven branch historically used empty prompt
+        nonlocal stdin_sel
+        if stdin_sel is None:
+            stdin_sel = selectors.DefaultSelector()
+            try:
+                stdin_sel.register(sys.stdin, selectors.EVENT_READ)
+            except (OSError, ValueError):
+                stdin_sel.close()
+                stdin_sel = selectors.SelectSelector()
+                stdin_sel.register(sys.stdin, selectors.EVENT_READ)
+            stdin_sel.register(auto_exit_evt, selectors.EVENT_READ)
         while True:
             if auto_exit_evt.is_set():
                 return None
-            r, _, _ = select.select([sys.stdin], [], [], 0.1)
-            if r:
-                line = sys.stdin.readline()
-                if line == "":
-                    return None
-                return line
+            for key, _ in stdin_sel.select():
+                if key.fileobj is sys.stdin:
+                    line = sys.stdin.readline()
+                    if line == "":
+                        return None
+                    return line
 
     # Banner + help (console-style)
     _print_console_header_and_help(
@@ -864,6 +1056,7 @@ def main(argv=None):
                 tx_state=tx_state if getattr(cs, "MANUAL_PROMPT_CONSIDER_TX", True) else None,
             )
 
+    area = None  # closed on re-arm and shutdown (see _close_area)
     try:
         area = _load_area(args.area, area_kwargs)
         time_profile = _load_time(
@@ -905,6 +1098,7 @@ def main(argv=None):
         _switch_to_end_due_to_error(
             f"Failed to load campaign (area='{args.area}', time='{args.time}'): {e}"
         )
+        _close_area(area)
         area = None
         time_profile = None
 
@@ -999,19 +1193,10 @@ def main(argv=None):
                         if cmd == "exit":
                             return 0
                         if cmd == "help":
-                            _print_rule_small()
-                            print(cs.colorize("Console commands", cs.SECTION_HEADER_STYLE))
-                            print(cs.colorize(cs.CONSOLE_HELP.rstrip(), cs.HELP_BODY_STYLE))
-                            _print_rule_small()
-                            print(cs.colorize("SEM IP commands", cs.SECTION_HEADER_STYLE))
-                            print(cs.colorize(cs.SEM_CHEATSHEET.rstrip(), cs.HELP_BODY_STYLE))
-                            _print_rule_small()
+                            _print_help_all()
                             continue
                         if cmd == "sem":
-                            _print_rule_small()
-                            print(cs.colorize("SEM IP commands", cs.SECTION_HEADER_STYLE))
-                            print(cs.colorize(cs.SEM_CHEATSHEET.rstrip(), cs.HELP_BODY_STYLE))
-                            _print_rule_small()
+                            _print_help_sem_only()
                             continue
                         if cmd == "resume":
                             _info("Use 'resume' from manual prompt.")
@@ -1034,18 +1219,9 @@ def main(argv=None):
                             pass
                         break
                     if cmd == "help":
-                        _print_rule_small()
-                        print(cs.colorize("Console commands", cs.SECTION_HEADER_STYLE))
-                        print(cs.colorize(cs.CONSOLE_HELP.rstrip(), cs.HELP_BODY_STYLE))
-                        _print_rule_small()
-                        print(cs.colorize("SEM IP commands", cs.SECTION_HEADER_STYLE))
-                        print(cs.colorize(cs.SEM_CHEATSHEET.rstrip(), cs.HELP_BODY_STYLE))
-                        _print_rule_small();  continue
+                        _print_help_all();  continue
                     if cmd == "sem":
-                        _print_rule_small()
-                        print(cs.colorize("SEM IP commands", cs.SECTION_HEADER_STYLE))
-                        print(cs.colorize(cs.SEM_CHEATSHEET.rstrip(), cs.HELP_BODY_STYLE))
-                        _print_rule_small();  continue
+                        _print_help_sem_only();  continue
                     if cmd == "status":
                         rx_enabled.clear()
                         try:
@@ -1095,13 +1271,14 @@ def main(argv=None):
                     if not raw: continue
 
                     if raw == "resume":
-                        if not _preflight_sem(proto, log, rx_enabled,
+                        if not _preflight_sem(proto, log, rx_hook,
                                               attempts=max(1, int(args.preflight_attempts)),
                                               interval_s=max(0.05, float(args.preflight_interval))):
                             _error("Device not responding yet. Resolve and 'resume' again.")
                             continue
                         try:
                             if time_profile is None or not getattr(time_profile, "is_alive", lambda: False)():
+                                _close_area(area)
                                 area = _load_area(args.area, area_kwargs)
                                 time_profile = _load_time(
                                     args.time,
@@ -1142,19 +1319,10 @@ def main(argv=None):
                         continue
 
                     if raw == "help":
-                        _print_rule_small()
-                        print(cs.colorize("Console commands", cs.SECTION_HEADER_STYLE))
-                        print(cs.colorize(cs.CONSOLE_HELP.rstrip(), cs.HELP_BODY_STYLE))
-                        _print_rule_small()
-                        print(cs.colorize("SEM IP commands", cs.SECTION_HEADER_STYLE))
-                        print(cs.colorize(cs.SEM_CHEATSHEET.rstrip(), cs.HELP_BODY_STYLE))
-                        _print_rule_small();  continue
+                        _print_help_all();  continue
 
                     if raw == "sem":
-                        _print_rule_small()
-                        print(cs.colorize("SEM IP commands", cs.SECTION_HEADER_STYLE))
-                        print(cs.colorize(cs.SEM_CHEATSHEET.rstrip(), cs.HELP_BODY_STYLE))
-                        _print_rule_small();  continue
+                        _print_help_sem_only();  continue
 
                     if raw == "exit":
                         try:
@@ -1179,6 +1347,10 @@ def main(argv=None):
     finally:
         stop_evt.set()
         time.sleep(0.1)
+        if stdin_sel is not None:
+            stdin_sel.close()
+        auto_exit_evt.close()
+        _close_area(area)
         try: tr.close()
         finally: log.close()   # writes deferred events now
     return 0
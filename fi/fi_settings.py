@@ -70,10 +70,18 @@ EBD_DEFAULT_PATH       = "build/design.ebd"
 ACME_DEFAULT_BOARD     = "xcku040"
 
 # Directory where ACME-derived address lists are cached. The filename encodes
-# the board, EBD filesize/mtime and a short hash of the path to avoid clashes.
+# the board, EBD name and a short hash of the path to avoid clashes; a sidecar
+# .meta.json ties each list to the EBD content it was built from.
 # This keeps repeated runs fast and deterministic.
 ACME_CACHE_DIR         = f"{LOG_DIR}/.acme_cache"
 
+# ---------- Area ordering -----------------------------------------------------
+# Shuffle large address lists with NumPy's PCG64 permutation (C speed) instead
+# of random.Random.shuffle. Only honored if NumPy is installed. Note that the
+# order produced for a given seed differs between the two generators, so keep
+# this fixed across runs that must be comparable.
+AREA_SHUFFLE_NUMPY     = False
+
 # -----------------------------------------------------------------------------
 # End of file
 # -----------------------------------------------------------------------------
@@ -5,7 +5,8 @@
 # Event logger for fault-injection sessions.
 #
 # Responsibilities
-#   • Collect timestamped events in memory (deferred write).
+#   • Collect timestamped events in memory (deferred write); batches of RX
+#     lines can be recorded under a single timestamp (log_rx_many).
 #   • Enforce per-class enablement (tags toggled via fi/settings.py).
 #   • Emit a single per-session file with a structured header:
 #       - Title
@@ -33,7 +34,9 @@ from __future__ import annotations
 
 import os
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from itertools import repeat
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
 from fi import settings
 from fi.console import console_settings as cs
@@ -57,9 +60,10 @@ class EventLogger:
         self._out_dir = os.path.join(self._root_dir, self._run, self._session)
         self._path = os.path.join(self._out_dir, self._FILENAME)
 
-        # Deferred storage and timing origin
+        # Deferred storage and timing origin. A deque appends in O(1) without
+        # the periodic regrow-and-copy a list does during long campaigns.
         self._t0 = time.monotonic()
-        self._events: List[Tuple[float, str, str]] = []  # (delta_s, tag, text)
+        self._events: Deque[Tuple[float, str, str, str]] = deque()  # (delta_s, tag, head, text)
 
         # Header base fields
         self._hdr_device: Optional[str] = None
@@ -126,7 +130,20 @@ class EventLogger:
 
     def log_rx(self, line: str) -> None:
         """UART receive monitor entry."""
-        self._append("SEM CMD", f"[RECV]: {line}")
+        self._append("SEM CMD", line, "[RECV]: ")
+
+    def log_rx_many(self, lines: Iterable[str]) -> None:
+        """
+        Several UART receive entries at once (e.g. a parsed status snapshot).
+        The tag is checked and the clock read once; all lines share that stamp.
+        Lines are stored as-is (the "[RECV]: " head is joined in close()), so
+        the batch is appended by deque.extend(zip(...)) with no Python-level
+        work per line on the caller's (RX printer) thread.
+        """
+        if not self._tag_enabled("SEM CMD"):
+            return
+        dt = time.monotonic() - self._t0
+        self._events.extend(zip(repeat(dt), repeat("SEM CMD"), repeat("[RECV]: "), lines))
 
     def log_info(self, msg: str) -> None:
         """Generic informational event."""
@@ -202,20 +219,20 @@ class EventLogger:
         lines.append(rule_big)
 
         # Events
-        for (dt, tag, text) in self._events:
-            lines.append(f"[+{dt:8.3f}s] {tag} {text}")
+        for (dt, tag, head, text) in self._events:
+            lines.append(f"[+{dt:8.3f}s] {tag} {head}{text}")
 
         # Persist
         with open(self._path, "w", encoding="utf-8") as f:
             f.write("\n".join(lines) + "\n")
 
     # ------------------------------ internals ---------------------------------
-    def _append(self, tag: str, text: str) -> None:
-        """Append if tag is enabled."""
+    def _append(self, tag: str, text: str, head: str = "") -> None:
+        """Append if tag is enabled; 'head' is prefixed to text on close()."""
         if not self._tag_enabled(tag):
             return
         dt = time.monotonic() - self._t0
-        self._events.append((dt, tag, text))
+        self._events.append((dt, tag, head, text))
 
     def _enabled_tag_names(self) -> List[str]:
         """Return the enabled tag names, filtered to the set known by the logger."""
@@ -22,7 +22,7 @@ from __future__ import annotations
 
 import re
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from fi.semio.transport import SemTransport
 from fi.console import console_settings as cs
@@ -37,8 +37,11 @@ class SemProtocol:
 
     def __init__(self, tr: SemTransport) -> None:
         self._tr = tr
-        # Compile prompt detector once using the console’s pattern.
-        self._re_prompt = re.compile(getattr(cs, "PROMPT_REGEX", r"^[IOD]>\s*$"))
+        self.tr = tr  # canonical public handle for helpers (fi/core/injector.py)
+        # Prompt detector shared with the transport (compiled once in console settings).
+        self._re_prompt = getattr(cs, "PROMPT_RE", None) or re.compile(getattr(cs, "PROMPT_REGEX", r"^[IOD]>\s*$"))
+        # Line terminator pre-encoded for the byte-level injection path.
+        self._term_b = str(getattr(cs, "CR_TERMINATOR", "\r")).encode("ascii")
 
     # ------------------------------- primitives --------------------------------
     def sync_prompt(self, *, window_s: float = 0.5) -> None:
@@ -86,12 +89,16 @@ class SemProtocol:
                 counters[m.group(1)] = m.group(2)
         return counters
 
-    def inject_lfa(self, lfa_hex: str) -> None:
+    def inject_lfa(self, lfa_hex: Union[str, bytes]) -> None:
         """
         Issue an injection command using the LFA encoding. No implicit state
         management occurs here; higher layers own policy decisions.
+        Accepts the LFA as str or as ASCII bytes; the command is assembled as
+        bytes and written in one write_raw() call either way.
         """
-        self._tr.write_line(f"N {lfa_hex}")
+        if isinstance(lfa_hex, str):
+            lfa_hex = lfa_hex.encode("ascii", errors="ignore")
+        self._tr.write_raw(b"N " + lfa_hex + self._term_b)
 
     def passthrough(self, raw: str) -> None:
         """Send an arbitrary raw SEM command line."""
@@ -9,8 +9,9 @@
 #   • Perform newline-terminated writes with the configured terminator.
 #   • Run a single background reader that accumulates bytes, frames CR/LF
 #     terminated lines, and enqueues them for non-blocking consumption.
-#   • Provide thread-safe APIs to drain framed lines (read_lines) and to read
-#     until a prompt-like line is observed (read_until_prompt).
+#   • Provide thread-safe APIs to drain framed lines (read_lines), to block
+#     until lines are queued (wait_for_lines) and to read until a prompt-like
+#     line is observed (read_until_prompt).
 #
 # Design
 #   • Exactly one reader thread per transport instance drains the OS buffer and
@@ -53,7 +54,9 @@ class SemTransport:
     Serial transport with:
       • start_reader(): spawns a background thread that frames CR/LF lines.
       • write_line(text): writes a full line using the configured terminator.
+      • write_raw(data): writes pre-encoded bytes as-is (caller terminates).
       • read_lines(timeout_s): drains framed lines within a timeout window.
+      • wait_for_lines(timeout_s): blocks until lines are queued (no drain).
       • read_until_prompt(timeout_s): drains lines until a prompt-like line.
     The writer never blocks on the background reader; only the OS buffer limits
     apply to writes.
@@ -73,8 +76,8 @@ class SemTransport:
         self._buf = bytearray()
         self._last_rx_monotonic = time.monotonic()
 
-        # Compile prompt detector (used by read_until_prompt)
-        self._re_prompt = re.compile(getattr(cs, "PROMPT_REGEX", r"^[IOD]>\s*$"))
+        # Prompt detector (used by read_until_prompt), compiled once in console settings
+        self._re_prompt = getattr(cs, "PROMPT_RE", None) or re.compile(getattr(cs, "PROMPT_REGEX", r"^[IOD]>\s*$"))
 
     # ---------------------------- lifecycle -----------------------------------
     def open(self) -> None:
@@ -122,6 +125,18 @@ class SemTransport:
         if n != len(data):
             raise RuntimeError("Short write on serial port")
 
+    def write_raw(self, data: bytes) -> None:
+        """
+        Write an already-encoded, already-terminated command to the UART.
+        Used on hot paths that build the bytes themselves (see
+        SemProtocol.inject_lfa) to skip the str checks and encode above.
+        """
+        if self._ser is None:
+            raise RuntimeError("Serial port not open")
+        n = self._ser.write(data)
+        if n != len(data):
+            raise RuntimeError("Short write on serial port")
+
     # ---------------------------- reader --------------------------------------
     def start_reader(self) -> None:
         """
@@ -140,19 +155,27 @@ class SemTransport:
         queue is empty, wait up to timeout_s for new lines to arrive.
         """
         deadline = time.monotonic() + max(0.0, float(timeout_s))
-        out: List[str] = []
         with self._cv:
-            while True:
-                while self._lines:
-                    out.append(self._lines.popleft())
-                if out:
-                    break
+            while not self._lines:
                 remaining = deadline - time.monotonic()
                 if remaining <= 0:
-                    break
+                    return []
                 self._cv.wait(timeout=remaining)
+            # Take the whole queue in one step (C-level copy + clear) so the
+            # reader is held off for a single swap, not one popleft per line.
+            out = list(self._lines)
+            self._lines.clear()
         return out
 
+    def wait_for_lines(self, *, timeout_s: float) -> bool:
+        """
+        Block until at least one framed line is queued or timeout_s expires,
+        without consuming anything. Lets a consumer sleep on the reader's
+        condition and still decide whether to drain once woken.
+        """
+        with self._cv:
+            return bool(self._cv.wait_for(lambda: self._lines, timeout=max(0.0, float(timeout_s))))
+
     def read_until_prompt(self, *, timeout_s: float = 0.5) -> List[str]:
         """
         Drain framed lines until a prompt-like line is seen or the timeout
@@ -181,9 +204,10 @@ class SemTransport:
         if ser is None:
             return
 
-        term_cr = b"\r"
-        term_lf = b"\n"
-
+        # Framing runs once per chunk with C-level bytes/str methods: cut the
+        # buffer after its last CR/LF, decode that span once, split it on
+        # either terminator and queue the non-blank lines under one lock.
+        # Paired terminators (CRLF) only yield blank lines, which are dropped.
         while not self._rx_stop.is_set():
             try:
                 chunk = ser.read(1024)
@@ -193,30 +217,21 @@ class SemTransport:
             if not chunk:
                 continue
 
-            self._buf.extend(chunk)
+            buf = self._buf
+            buf.extend(chunk)
             self._last_rx_monotonic = time.monotonic()
 
-            # Frame on CR or LF; ignore empty lines and strip trailing CR/LF.
-            while True:
-                cr_idx = self._buf.find(term_cr)
-                lf_idx = self._buf.find(term_lf)
-                # Choose earliest terminator found (if any)
-                idxs = [i for i in (cr_idx, lf_idx) if i != -1]
-                if not idxs:
-                    break
-                cut = min(idxs)
-                line = self._buf[:cut].decode("ascii", errors="ignore")
-                # Drop the terminator and any paired CRLF
-                drop = 1
-                if cut + 1 < len(self._buf) and self._buf[cut] in (term_cr[0], term_lf[0]) and self._buf[cut+1] in (term_cr[0], term_lf[0]):
-                    drop = 2
-                # Remove consumed bytes
-                del self._buf[:cut + drop]
-                if line.strip() == "":
-                    continue
-                with self._cv:
-                    self._lines.append(line)
-                    self._cv.notify_all()
+            cut = max(buf.rfind(b"\r"), buf.rfind(b"\n"))
+            if cut < 0:
+                continue
+            text = buf[:cut].decode("ascii", errors="ignore")
+            del buf[:cut + 1]
+            lines = [ln for ln in text.replace("\r", "\n").split("\n") if ln and not ln.isspace()]
+            if not lines:
+                continue
+            with self._cv:
+                self._lines.extend(lines)
+                self._cv.notify_all()
 
     # ---------------------------- helpers -------------------------------------
     def is_open(self) -> bool: